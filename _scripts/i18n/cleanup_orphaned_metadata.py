@@ -7,27 +7,85 @@ strings in the strings.xml file.
 """
 
 import json
-import yaml
+import mmap
+import re
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Dict, Set, List
-from metadata_io import create_metadata_io
+from typing import Dict, Set, List, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is used otherwise
+    orjson = None
 
-def get_strings_from_xml(xml_path: Path) -> Set[str]:
-    """Extract all string keys from strings.xml."""
-    if not xml_path.exists():
+# Cached key set of strings.xml, stored in the metadata directory
+STRINGS_KEYS_CACHE = ".strings_keys.cache"
+
+
+def load_json(path: Path) -> Dict:
+    """Load a JSON file, decoding straight from a memory map when orjson is available."""
+    with open(path, 'rb') as f:
+        if orjson is None:
+            return json.load(f)
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def save_json(path: Path, data: Dict):
+    """Write a JSON file with 2-space indentation, using orjson when available."""
+    if orjson is None:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+    else:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+
+
+def get_strings_from_xml(xml_path: Path, cache_path: Optional[Path] = None) -> Set[str]:
+    """
+    Extract all string keys from strings.xml.
+
+    Args:
+        xml_path: Path to strings.xml
+        cache_path: Optional key cache file. It stores the XML's mtime/size on the
+            first line and one key per line after it, so repeated runs (dry run,
+            then --execute) skip parsing an unchanged file.
+    """
+    try:
+        stat = xml_path.stat()
+    except FileNotFoundError:
         print(f"✗ Strings file not found: {xml_path}")
         return set()
 
-    tree = ET.parse(xml_path)
-    root = tree.getroot()
+    signature = f"{stat.st_mtime_ns} {stat.st_size}"
+
+    if cache_path is not None:
+        try:
+            cached = cache_path.read_text(encoding='utf-8').split('\n')
+        except OSError:
+            cached = None
+        if cached and cached[0] == signature:
+            return set(key for key in cached[1:] if key)
 
     string_keys = set()
-    for string_elem in root.findall('.//string'):
-        key = string_elem.get('name')
-        if key:
-            string_keys.add(key)
+
+    # Stream the file instead of building the full DOM; each <string> is
+    # cleared as soon as its name has been read.
+    context = ET.iterparse(xml_path, events=('end',))
+    for _, elem in context:
+        if elem.tag == 'string':
+            key = elem.get('name')
+            if key:
+                string_keys.add(key)
+            elem.clear()
+    context.root.clear()
+
+    if cache_path is not None:
+        try:
+            cache_path.write_text('\n'.join([signature, *sorted(string_keys)]), encoding='utf-8')
+        except OSError:
+            pass  # Cache is best-effort
 
     return string_keys
 
@@ -40,30 +98,43 @@ def find_orphaned_metadata(metadata_dir: Path, xml_path: Path) -> Dict[str, List
         Dictionary mapping category to list of orphaned string keys
     """
     # Get all strings from XML
-    xml_strings = get_strings_from_xml(xml_path)
-
-    # Load metadata
-    metadata_io = create_metadata_io(metadata_dir.parent, metadata_dir.name)
+    xml_strings = get_strings_from_xml(xml_path, metadata_dir / STRINGS_KEYS_CACHE)
 
     orphaned_by_category = {}
 
     # Check each category
-    index_path = metadata_dir / "index.json"
-    with open(index_path, 'r', encoding='utf-8') as f:
-        index = json.load(f)
+    index = load_json(metadata_dir / "index.json")
 
     for category, string_keys in index.get('categories', {}).items():
-        orphaned = []
-        for string_key in string_keys:
-            if string_key not in xml_strings:
-                orphaned.append(string_key)
+        # Common case: every indexed key is still in strings.xml
+        if xml_strings.issuperset(string_keys):
+            continue
 
-        if orphaned:
-            orphaned_by_category[category] = orphaned
+        orphaned_by_category[category] = sorted(set(string_keys).difference(xml_strings))
 
     return orphaned_by_category
 
 
+def remove_top_level_keys(content: str, keys: List[str]) -> Tuple[str, Set[str]]:
+    """
+    Splice top-level entries out of YAML text without re-serializing the file.
+
+    Each entry is the ``key:`` line at column 0 plus every indented (or blank)
+    line that follows it, which is the layout yaml.dump produces.
+
+    Returns:
+        Tuple of (updated content, set of keys that were removed)
+    """
+    removed = set()
+    for key in keys:
+        pattern = re.compile(rf'^{re.escape(key)}:[^\n]*(?:\n|\Z)(?:[ \t-][^\n]*(?:\n|\Z)|\n)*', re.MULTILINE)
+        content, count = pattern.subn('', content)
+        if count:
+            removed.add(key)
+
+    return content, removed
+
+
 def remove_orphaned_metadata(metadata_dir: Path, orphaned_by_category: Dict[str, List[str]], dry_run: bool = True):
     """
     Remove orphaned metadata from YAML files and update index.
@@ -73,8 +144,19 @@ def remove_orphaned_metadata(metadata_dir: Path, orphaned_by_category: Dict[str,
         orphaned_by_category: Dictionary mapping category to orphaned keys
         dry_run: If True, only print what would be done
     """
+    # PyYAML is only needed once there is something to remove
+    import yaml
+    try:
+        # libyaml-backed loader/dumper are several times faster than the pure-Python ones
+        from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+    except ImportError:
+        from yaml import SafeLoader, SafeDumper
+
     total_removed = 0
 
+    # Set views of the orphaned keys, built once for O(1) membership tests
+    orphaned_sets = {category: set(keys) for category, keys in orphaned_by_category.items()}
+
     for category, orphaned_keys in orphaned_by_category.items():
         category_path = metadata_dir / f"{category}.yaml"
 
@@ -84,23 +166,42 @@ def remove_orphaned_metadata(metadata_dir: Path, orphaned_by_category: Dict[str,
 
         # Load category file
         with open(category_path, 'r', encoding='utf-8') as f:
-            category_data = yaml.safe_load(f) or {}
-
-        # Remove orphaned keys
+            content = f.read()
+
+        # Fast path: drop top-level entries textually, leaving the rest of the file as-is
+        content, removed_keys = remove_top_level_keys(content, orphaned_keys)
+
+        # Fall back to a full YAML round-trip for keys the text scan couldn't find
+        category_data = None
+        remaining = orphaned_sets[category] - removed_keys
+        # Only parse when a leftover key occurs somewhere in the text (e.g. quoted);
+        # otherwise the file cannot contain it and the parse would be wasted
+        if any(key in content for key in remaining):
+            data = yaml.load(content, Loader=SafeLoader) or {}
+            found = remaining & data.keys()
+            if found:
+                for key in found:
+                    del data[key]
+                removed_keys.update(found)
+                category_data = data
+
+        # Report removed keys
         removed_count = 0
         for key in orphaned_keys:
-            if key in category_data:
+            if key in removed_keys:
                 if dry_run:
                     print(f"  Would remove: {key}")
                 else:
-                    del category_data[key]
                     print(f"  ✓ Removed: {key}")
                 removed_count += 1
 
         if removed_count > 0 and not dry_run:
             # Save updated category file
             with open(category_path, 'w', encoding='utf-8') as f:
-                yaml.dump(category_data, f, default_flow_style=False, allow_unicode=True, sort_keys=True)
+                if category_data is None:
+                    f.write(content)
+                else:
+                    yaml.dump(category_data, f, Dumper=SafeDumper, default_flow_style=False, allow_unicode=True, sort_keys=True)
             print(f"✓ Updated {category}.yaml (removed {removed_count} entries)")
 
         total_removed += removed_count
@@ -108,15 +209,14 @@ def remove_orphaned_metadata(metadata_dir: Path, orphaned_by_category: Dict[str,
     if not dry_run:
         # Update index.json
         index_path = metadata_dir / "index.json"
-        with open(index_path, 'r', encoding='utf-8') as f:
-            index = json.load(f)
+        index = load_json(index_path)
 
         # Remove orphaned keys from index
-        for category, orphaned_keys in orphaned_by_category.items():
+        for category, orphaned_set in orphaned_sets.items():
             if category in index.get('categories', {}):
                 index['categories'][category] = [
                     key for key in index['categories'][category]
-                    if key not in orphaned_keys
+                    if key not in orphaned_set
                 ]
 
                 # Remove empty categories
@@ -128,8 +228,7 @@ def remove_orphaned_metadata(metadata_dir: Path, orphaned_by_category: Dict[str,
             index['metadata']['last_updated'] = str(Path(__file__).stat().st_mtime)
 
         # Save updated index
-        with open(index_path, 'w', encoding='utf-8') as f:
-            json.dump(index, f, indent=2, ensure_ascii=False)
+        save_json(index_path, index)
 
         print(f"✓ Updated index.json")
 
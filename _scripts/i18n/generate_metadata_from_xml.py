@@ -17,13 +17,22 @@ Usage:
 
 import xml.etree.ElementTree as ET
 import yaml
+import os
 import re
+import shutil
 import subprocess
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 import sys
 
+try:
+    # libyaml-backed dumper is several times faster than the pure-Python one
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
+
 # Paths
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 STRINGS_XML = PROJECT_ROOT / "presentation" / "src" / "main" / "res" / "values" / "strings.xml"
@@ -33,6 +42,29 @@ RES_DIR = PROJECT_ROOT / "presentation" / "src" / "main" / "res"
 LAYOUT_DIR = RES_DIR / "layout"
 METADATA_DIR = Path(__file__).parent / "metadata_divesms"
 
+# Reference patterns for --enrich (group 1 is the string key)
+CODE_REF_PATTERN = re.compile(r'R\.string\.(\w+)')
+LAYOUT_REF_PATTERN = re.compile(r'@string/(\w+)')
+
+# Technical analysis patterns, compiled once at import
+EMOJI_PATTERN = re.compile("["
+    u"\U0001F600-\U0001F64F"  # emoticons
+    u"\U0001F300-\U0001F5FF"  # symbols & pictographs
+    u"\U0001F680-\U0001F6FF"  # transport & map symbols
+    u"\U0001F1E0-\U0001F1FF"  # flags
+    u"\U00002702-\U000027B0"
+    u"\U000024C2-\U0001F251"
+    "]+", flags=re.UNICODE)
+FORMAT_SPECIFIER_PATTERN = re.compile(r'(%(?:\d+\$)?[sdifgeoxX])')  # %s, %d, %1$s, etc.
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+
+# Reported paths are made relative to the project root by stripping this prefix
+_ROOT_PREFIX = str(PROJECT_ROOT) + os.sep
+
+# string_key -> referencing files, built once by build_reference_indices()
+_code_refs_index: Optional[Dict[str, List[str]]] = None
+_layout_refs_index: Optional[Dict[str, List[str]]] = None
+
 # Category patterns for DiveSMS
 CATEGORY_PATTERNS = {
     # Branding & About
@@ -158,33 +190,77 @@ CATEGORY_TEMPLATES = {
     },
 }
 
-def get_category(string_key: str) -> str:
-    """Determine category for a string key"""
-    key_lower = string_key.lower()
+# Translation guidance per category, built once and shared by every string in the
+# category (never mutated after generation; sort_mapping copies it before dumping)
+DEFAULT_GUIDANCE = {
+    'tone': 'neutral',
+    'style': 'descriptive'
+}
+GUIDANCE_BY_CATEGORY = {
+    category: {
+        'tone': template['tone'],
+        'style': template['style'],
+        'terminology': {
+            'domain': template['domain']
+        }
+    }
+    for category, template in CATEGORY_TEMPLATES.items()
+}
 
-    # Check each category pattern
-    for category, patterns in CATEGORY_PATTERNS.items():
+# Extra characters allowed per key type, first match wins (None = no strict limit)
+MAX_LENGTH_RULES = (
+    (('button', 'menu_'), 15),       # Button text, menu items
+    (('title',), 20),                # Titles, headers
+    (('hint',), 25),                 # Hints, placeholders
+    (('message', 'summary'), None),  # Messages, descriptions (more flexible)
+)
+
+# Key substring -> UI element type, first match wins
+UI_ELEMENT_RULES = (
+    ('button', 'button'),
+    ('title', 'title'),
+    ('hint', 'hint'),
+    ('error', 'error_message'),
+    ('message', 'text'),
+    ('summary', 'description'),
+    ('label', 'label'),
+)
+
+def _build_category_matcher():
+    """Fold all category patterns into a single regex scan
+
+    Patterns are substring matches and the earliest category in CATEGORY_PATTERNS
+    wins, so every pattern maps to its (priority, category). Alternatives are
+    ordered by priority and wrapped in a lookahead so one findall reports the
+    best pattern at every position of the key.
+    """
+    pattern_categories = {}
+    for priority, (category, patterns) in enumerate(CATEGORY_PATTERNS.items()):
         for pattern in patterns:
-            if pattern in key_lower:
-                return category
+            pattern_categories.setdefault(pattern, (priority, category))
+
+    ordered = sorted(pattern_categories, key=pattern_categories.get)
+    matcher = re.compile("(?=(" + "|".join(re.escape(p) for p in ordered) + "))")
+    return matcher, pattern_categories
+
+_CATEGORY_MATCHER, _PATTERN_CATEGORIES = _build_category_matcher()
+
+def get_category(string_key: str) -> str:
+    """Determine category for a string key"""
+    matches = _CATEGORY_MATCHER.findall(string_key.lower())
+    if not matches:
+        return 'other'
 
-    return 'other'
+    # Lowest priority number = first matching category in CATEGORY_PATTERNS
+    return min(_PATTERN_CATEGORIES[m] for m in matches)[1]
 
 def extract_emoji(text: str) -> tuple:
     """Extract emoji from string if present"""
-    if not text:
+    # Every emoji range is far outside ASCII, so skip the regex for plain strings
+    if not text or text.isascii():
         return None, None
 
-    emoji_pattern = re.compile("["
-        u"\U0001F600-\U0001F64F"  # emoticons
-        u"\U0001F300-\U0001F5FF"  # symbols & pictographs
-        u"\U0001F680-\U0001F6FF"  # transport & map symbols
-        u"\U0001F1E0-\U0001F1FF"  # flags
-        u"\U00002702-\U000027B0"
-        u"\U000024C2-\U0001F251"
-        "]+", flags=re.UNICODE)
-
-    match = emoji_pattern.search(text)
+    match = EMOJI_PATTERN.search(text)
     if match:
         emoji = match.group()
         if text.startswith(emoji):
@@ -203,9 +279,7 @@ def has_format_specifiers(text: str) -> tuple:
 
     specifiers = []
 
-    # Pattern for %s, %d, %1$s, etc.
-    pattern = r'(%(?:\d+\$)?[sdifgeoxX])'
-    matches = re.finditer(pattern, text)
+    matches = FORMAT_SPECIFIER_PATTERN.finditer(text)
 
     for i, match in enumerate(matches, 1):
         specifiers.append({
@@ -219,7 +293,7 @@ def has_html(text: str) -> bool:
     """Check if string has HTML formatting"""
     if not text:
         return False
-    return bool(re.search(r'<[^>]+>', text))
+    return bool(HTML_TAG_PATTERN.search(text))
 
 def estimate_max_length(string_key: str, string_value: str) -> Optional[int]:
     """Estimate reasonable max length based on string type"""
@@ -232,106 +306,128 @@ def estimate_max_length(string_key: str, string_value: str) -> Optional[int]:
     if current_len <= 15:
         return current_len + 10
 
-    # Button text, menu items
-    if 'button' in string_key or 'menu_' in string_key:
-        return current_len + 15
-
-    # Titles, headers
-    if 'title' in string_key:
-        return current_len + 20
-
-    # Hints, placeholders
-    if 'hint' in string_key:
-        return current_len + 25
-
-    # Messages, descriptions (more flexible)
-    if 'message' in string_key or 'summary' in string_key:
-        return None  # No strict limit
+    for needles, extra in MAX_LENGTH_RULES:
+        for needle in needles:
+            if needle in string_key:
+                return current_len + extra if extra is not None else None
 
     # Default: add 30% buffer
     return int(current_len * 1.3)
 
-def search_in_code(string_key: str) -> List[str]:
-    """Search for string usage in Java/Kotlin code (optional enrichment)"""
-    pattern = f"R\\.string\\.{string_key}"
-    refs = []
+def _iter_files(directory: str):
+    """Yield all file paths under directory in sorted order"""
+    with os.scandir(directory) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _iter_files(entry.path)
+        elif entry.is_file():
+            yield entry.path
+
+def _rg_references(src_dir: Path, pattern: re.Pattern) -> Optional[Dict[str, List[str]]]:
+    """Collect references with a single ripgrep run (None if rg is unavailable)"""
+    rg = shutil.which("rg")
+    if rg is None:
+        return None
+
+    try:
+        result = subprocess.run(
+            [rg, "--no-heading", "--no-line-number", "--only-matching", "--sort", "path",
+             pattern.pattern, str(src_dir)],
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+    except (subprocess.TimeoutExpired, OSError):
+        return None
+
+    # rg exits with 1 when nothing matched
+    if result.returncode not in (0, 1):
+        return None
 
-    for src_dir in [JAVA_SRC, KOTLIN_SRC]:
-        if not src_dir.exists():
+    index = defaultdict(list)
+    for line in result.stdout.splitlines():
+        path, _, match = line.rpartition(':')
+        key_match = pattern.fullmatch(match)
+        if not key_match or not path.startswith(_ROOT_PREFIX):
             continue
+        rel_path = path[len(_ROOT_PREFIX):]
+        refs = index[key_match.group(1)]
+        if not refs or refs[-1] != rel_path:
+            refs.append(rel_path)
+
+    return index
 
+def _scan_references(src_dir: Path, pattern: re.Pattern) -> Dict[str, List[str]]:
+    """Collect references by reading every file under src_dir once"""
+    index = defaultdict(list)
+
+    for path in _iter_files(str(src_dir)):
         try:
-            result = subprocess.run(
-                ["grep", "-r", "-l", pattern, str(src_dir)],
-                capture_output=True,
-                text=True,
-                timeout=3
-            )
-
-            if result.returncode == 0 and result.stdout:
-                for line in result.stdout.strip().split('\n'):
-                    if line:
-                        try:
-                            rel_path = Path(line).relative_to(PROJECT_ROOT)
-                            refs.append(str(rel_path))
-                        except ValueError:
-                            pass
-        except (subprocess.TimeoutExpired, Exception):
-            pass
-
-    return refs[:3]  # Limit to first 3 references
+            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+                content = f.read()
+        except OSError:
+            continue
 
-def search_in_layouts(string_key: str) -> List[str]:
-    """Search for string usage in layout XML files (optional enrichment)"""
-    if not LAYOUT_DIR.exists():
-        return []
+        rel_path = path[len(_ROOT_PREFIX):]
+        for key in dict.fromkeys(pattern.findall(content)):
+            index[key].append(rel_path)
 
-    pattern = f"@string/{string_key}"
-    refs = []
+    return index
 
-    try:
-        result = subprocess.run(
-            ["grep", "-r", "-l", pattern, str(LAYOUT_DIR)],
-            capture_output=True,
-            text=True,
-            timeout=3
-        )
+def _collect_references(src_dir: Path, pattern: re.Pattern) -> Dict[str, List[str]]:
+    """Map string keys to referencing files under one directory"""
+    if not src_dir.exists():
+        return {}
+
+    refs = _rg_references(src_dir, pattern)
+    if refs is None:
+        refs = _scan_references(src_dir, pattern)
+
+    return refs
+
+def build_reference_indices():
+    """Index code and layout references once so per-string lookups are O(1)"""
+    global _code_refs_index, _layout_refs_index
+
+    # Source trees are scanned concurrently; rg runs and file reads are I/O bound
+    src_dirs = [JAVA_SRC, KOTLIN_SRC, LAYOUT_DIR]
+    patterns = [CODE_REF_PATTERN, CODE_REF_PATTERN, LAYOUT_REF_PATTERN]
+    with ThreadPoolExecutor(max_workers=len(src_dirs)) as executor:
+        java_refs, kotlin_refs, layout_refs = executor.map(_collect_references, src_dirs, patterns)
+
+    code_refs = defaultdict(list)
+    for refs in (java_refs, kotlin_refs):
+        for key, files in refs.items():
+            code_refs[key].extend(files)
+
+    _code_refs_index = dict(code_refs)
+    _layout_refs_index = dict(layout_refs)
+
+def search_in_code(string_key: str) -> List[str]:
+    """Search for string usage in Java/Kotlin code (optional enrichment)"""
+    if _code_refs_index is None:
+        build_reference_indices()
 
-        if result.returncode == 0 and result.stdout:
-            for line in result.stdout.strip().split('\n'):
-                if line:
-                    try:
-                        rel_path = Path(line).relative_to(PROJECT_ROOT)
-                        refs.append(str(rel_path))
-                    except ValueError:
-                        pass
-    except (subprocess.TimeoutExpired, Exception):
-        pass
+    return _code_refs_index.get(string_key, [])[:3]  # Limit to first 3 references
+
+def search_in_layouts(string_key: str) -> List[str]:
+    """Search for string usage in layout XML files (optional enrichment)"""
+    if _layout_refs_index is None:
+        build_reference_indices()
 
-    return refs[:2]  # Limit to first 2 references
+    return _layout_refs_index.get(string_key, [])[:2]  # Limit to first 2 references
 
 def infer_ui_element(string_key: str, code_refs: List[str], layout_refs: List[str]) -> str:
     """Infer UI element type from context"""
     key_lower = string_key.lower()
 
-    if 'button' in key_lower:
-        return 'button'
-    elif 'title' in key_lower:
-        return 'title'
-    elif 'hint' in key_lower:
-        return 'hint'
-    elif 'error' in key_lower:
-        return 'error_message'
-    elif 'message' in key_lower:
-        return 'text'
-    elif 'summary' in key_lower:
-        return 'description'
-    elif 'label' in key_lower:
-        return 'label'
-    elif layout_refs:
-        return 'text'
-    else:
-        return 'text'
+    for needle, element in UI_ELEMENT_RULES:
+        if needle in key_lower:
+            return element
+
+    return 'text'
 
 def infer_screen(code_refs: List[str]) -> Optional[str]:
     """Infer screen name from code references"""
@@ -368,10 +464,7 @@ def generate_metadata(string_key: str, string_value: str, category: str, enrich:
             'plurals': False
         },
         'constraints': {},
-        'translation_guidance': {
-            'tone': 'neutral',
-            'style': 'descriptive'
-        },
+        'translation_guidance': GUIDANCE_BY_CATEGORY.get(category, DEFAULT_GUIDANCE),
         'ui': {
             'element': infer_ui_element(string_key, [], []),
             'screen': 'Unknown'
@@ -393,15 +486,6 @@ def generate_metadata(string_key: str, string_value: str, category: str, enrich:
         metadata['constraints']['max_length'] = max_length
         metadata['constraints']['reason'] = 'Estimated UI space limitation'
 
-    # Apply category template
-    if category in CATEGORY_TEMPLATES:
-        template = CATEGORY_TEMPLATES[category]
-        metadata['translation_guidance']['tone'] = template['tone']
-        metadata['translation_guidance']['style'] = template['style']
-        metadata['translation_guidance']['terminology'] = {
-            'domain': template['domain']
-        }
-
     # Optional enrichment with code search
     if enrich:
         code_refs = search_in_code(string_key)
@@ -421,6 +505,14 @@ def generate_metadata(string_key: str, string_value: str, category: str, enrich:
 
     return metadata
 
+def sort_mapping(data):
+    """Return a copy of data with mapping keys sorted at every level"""
+    if isinstance(data, dict):
+        return {key: sort_mapping(data[key]) for key in sorted(data)}
+    if isinstance(data, list):
+        return [sort_mapping(item) for item in data]
+    return data
+
 def parse_strings_xml() -> Dict[str, str]:
     """Parse strings.xml and return all strings"""
     strings = {}
@@ -429,14 +521,15 @@ def parse_strings_xml() -> Dict[str, str]:
         print(f"❌ Error: {STRINGS_XML} not found")
         return strings
 
-    tree = ET.parse(STRINGS_XML)
-    root = tree.getroot()
-
-    for string_elem in root.findall('string'):
-        name = string_elem.get('name')
-        value = string_elem.text or ""
-        if name:
-            strings[name] = value
+    # Stream the file instead of building the full DOM
+    context = ET.iterparse(STRINGS_XML, events=('end',))
+    for _, elem in context:
+        if elem.tag == 'string':
+            name = elem.get('name')
+            if name:
+                strings[name] = elem.text or ""
+            elem.clear()
+    context.root.clear()
 
     return strings
 
@@ -468,14 +561,22 @@ def main():
     print(f"✓ Found {len(all_strings)} strings")
     print()
 
+    if args.enrich:
+        print("🔎 Indexing code and layout references...")
+        build_reference_indices()
+        print(f"✓ Indexed {len(_code_refs_index)} keys in code, {len(_layout_refs_index)} in layouts")
+        print()
+
     # Categorize and generate metadata
     print("🏷️  Categorizing and generating metadata...")
     categorized = defaultdict(dict)
+    stats = Counter()
 
     for i, (string_key, string_value) in enumerate(all_strings.items(), 1):
         category = get_category(string_key)
         metadata = generate_metadata(string_key, string_value, category, enrich=args.enrich)
         categorized[category][string_key] = metadata
+        stats[category] += 1
 
         # Progress indicator
         if i % 50 == 0:
@@ -486,8 +587,8 @@ def main():
 
     # Print statistics
     print("📊 Categorization statistics:")
-    for category, strings in sorted(categorized.items(), key=lambda x: len(x[1]), reverse=True):
-        print(f"  {category:20s}: {len(strings):3d} strings")
+    for category, count in stats.most_common():
+        print(f"  {category:20s}: {count:3d} strings")
     print()
 
     if args.dry_run:
@@ -505,10 +606,11 @@ def main():
     for category, strings in categorized.items():
         output_file = METADATA_DIR / f"{category}.yaml"
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            yaml.dump(strings, f, allow_unicode=True, sort_keys=True, default_flow_style=False)
+        # Keys are sorted once up front, so the dumper can emit in insertion order
+        with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            yaml.dump(sort_mapping(strings), f, Dumper=SafeDumper, allow_unicode=True, sort_keys=False, default_flow_style=False)
 
-        print(f"  ✓ Saved {len(strings)} strings to {output_file.name}")
+        print(f"  ✓ Saved {stats[category]} strings to {output_file.name}")
 
     print()
     print("=" * 80)
@@ -18,6 +18,9 @@ Usage:
     # Export for AI translation to Chinese
     python manage_string_metadata.py export zh
 
+    # Export without indentation, gzip-compressed
+    python manage_string_metadata.py export zh --compact --gzip
+
     # Show coverage statistics
     python manage_string_metadata.py stats
 
@@ -25,19 +28,51 @@ Usage:
     python manage_string_metadata.py add flat_new_string
 """
 
+import argparse
+import gzip
+import heapq
 import json
 import xml.etree.ElementTree as ET
 import sys
 import os
+from collections import Counter
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Any, Set, Tuple
+from datetime import date, datetime
 from metadata_io import create_metadata_io, MetadataIO
 
+try:
+    # lxml's C parser is much faster than ElementTree and can filter by tag
+    from lxml import etree as LET
+except ImportError:
+    LET = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def encode_json(data: Any, compact: bool = False) -> bytes:
+    """Serialize data to UTF-8 JSON (2-space indent unless compact)"""
+    if orjson is not None:
+        # orjson serializes straight to UTF-8 bytes, several times faster than json
+        option = orjson.OPT_NON_STR_KEYS
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if compact:
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
 
 class StringMetadata:
     """Represents metadata for a single string resource"""
 
+    __slots__ = ('key', 'category', 'ui', 'context', 'purpose', 'constraints',
+                 'translation_guidance', 'references', 'technical')
+
     def __init__(self, key: str, data: Dict[str, Any]):
         self.key = key
         self.category = data.get('category', '')
@@ -75,9 +110,17 @@ class MetadataManager:
     def __init__(self, metadata_file: Path, strings_file: Path):
         self.metadata_file = metadata_file  # Legacy path (for backward compatibility)
         self.strings_file = strings_file
-        self.metadata: Dict[str, StringMetadata] = {}
+        # Raw metadata dicts; StringMetadata objects are built on demand in get_metadata()
+        self._raw: Dict[str, Dict[str, Any]] = {}
+        self._built: Dict[str, StringMetadata] = {}
         self.file_data: Dict[str, Any] = {}
 
+        # Parsed strings.xml keyed by the file's (mtime_ns, size) at parse time
+        self._xml_cache: Optional[Tuple[Tuple[int, int], Dict[str, str]]] = None
+
+        # Categories touched since the last save; None means every category is written
+        self._dirty_categories: Optional[Set[str]] = None
+
         # Initialize metadata_io for split format
         self.metadata_io: Optional[MetadataIO] = None
         i18n_dir = metadata_file.parent
@@ -91,16 +134,14 @@ class MetadataManager:
         # Try split format first
         if self.metadata_io and self.metadata_io.is_split_format():
             try:
-                strings_data = self.metadata_io.get_all_metadata()
-                for key, data in strings_data.items():
-                    self.metadata[key] = StringMetadata(key, data)
+                self._raw = self.metadata_io.get_all_metadata()
 
                 # Load project info from index
                 self.file_data = self.metadata_io.get_project_info()
                 self.file_data['total_strings'] = 0  # Will be updated by validate
-                self.file_data['documented_strings'] = len(self.metadata)
+                self.file_data['documented_strings'] = len(self._raw)
 
-                print(f"✓ Loaded {len(self.metadata)} string metadata entries (split format)")
+                print(f"✓ Loaded {len(self._raw)} string metadata entries (split format)")
                 return
             except Exception as e:
                 print(f"⚠ Error loading split format: {e}")
@@ -108,19 +149,20 @@ class MetadataManager:
 
         # Fall back to legacy JSON file
         if self.metadata_file.exists():
-            with open(self.metadata_file, 'r', encoding='utf-8') as f:
-                self.file_data = json.load(f)
-                strings_data = self.file_data.get('strings', {})
-                for key, data in strings_data.items():
-                    self.metadata[key] = StringMetadata(key, data)
-            print(f"✓ Loaded {len(self.metadata)} string metadata entries (legacy format)")
+            if orjson is not None:
+                self.file_data = orjson.loads(self.metadata_file.read_bytes())
+            else:
+                with open(self.metadata_file, 'r', encoding='utf-8') as f:
+                    self.file_data = json.load(f)
+            self._raw = dict(self.file_data.get('strings', {}))
+            print(f"✓ Loaded {len(self._raw)} string metadata entries (legacy format)")
         else:
             print(f"✗ Metadata file not found: {self.metadata_file}")
             self.file_data = {
                 "metadata_version": "1.0",
                 "project": "Wize SMS (DiveSMS)",
                 "default_locale": "en",
-                "last_updated": datetime.now().strftime("%Y-%m-%d"),
+                "last_updated": date.today().isoformat(),
                 "total_strings": 0,
                 "documented_strings": 0,
                 "strings": {}
@@ -135,95 +177,139 @@ class MetadataManager:
                 from collections import defaultdict
                 by_category = defaultdict(dict)
 
-                for key, meta in self.metadata.items():
+                for key, data in self._raw.items():
+                    meta = self._built.get(key) or StringMetadata(key, data)
                     category = meta.category or 'uncategorized'
                     by_category[category][key] = meta.to_dict()
 
-                # Save each category file
-                for category, strings in by_category.items():
-                    self.metadata_io.save_category(category, strings)
+                # Save each changed category file (all of them on the first save)
+                if self._dirty_categories is None:
+                    categories_to_save = list(by_category.keys())
+                else:
+                    categories_to_save = sorted(self._dirty_categories)
+                for category in categories_to_save:
+                    self.metadata_io.save_category(category, by_category.get(category, {}))
 
                 # Update index.json with counts
                 index_data = self.metadata_io._load_index()
-                index_data['documented_strings'] = len(self.metadata)
+                index_data['documented_strings'] = len(self._raw)
                 index_data['total_strings'] = self.file_data.get('total_strings', 0)
                 index_data['categories'] = {cat: sorted(strings.keys()) for cat, strings in by_category.items()}
                 index_data['files'] = {cat: f"metadata_divesms/{cat}.yaml" for cat in by_category.keys()}
                 self.metadata_io.save_index(index_data)
+                self._dirty_categories = set()
 
-                print(f"✓ Saved {len(self.metadata)} metadata entries to split format ({len(by_category)} categories)")
+                print(f"✓ Saved {len(self._raw)} metadata entries to split format ({len(by_category)} categories)")
                 return
             except Exception as e:
                 print(f"⚠ Error saving split format: {e}")
                 print(f"  Falling back to legacy format...")
 
         # Fall back to legacy JSON format
-        self.file_data['last_updated'] = datetime.now().strftime("%Y-%m-%d")
-        self.file_data['documented_strings'] = len(self.metadata)
+        self.file_data['last_updated'] = date.today().isoformat()
+        self.file_data['documented_strings'] = len(self._raw)
 
         # Convert metadata objects to dicts
         strings_dict = {}
-        for key, meta in self.metadata.items():
-            strings_dict[key] = meta.to_dict()
+        for key, data in self._raw.items():
+            strings_dict[key] = (self._built.get(key) or StringMetadata(key, data)).to_dict()
         self.file_data['strings'] = strings_dict
 
         # Write to file with nice formatting
-        with open(self.metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(self.file_data, f, indent=2, ensure_ascii=False)
+        self.metadata_file.write_bytes(encode_json(self.file_data))
 
-        print(f"✓ Saved {len(self.metadata)} metadata entries to legacy format: {self.metadata_file}")
+        print(f"✓ Saved {len(self._raw)} metadata entries to legacy format: {self.metadata_file}")
 
     def get_metadata(self, key: str) -> Optional[StringMetadata]:
         """Get metadata for a string key"""
-        return self.metadata.get(key)
+        meta = self._built.get(key)
+        if meta is None and key in self._raw:
+            meta = StringMetadata(key, self._raw[key])
+            self._built[key] = meta
+        return meta
 
     def add_metadata(self, key: str, data: Dict[str, Any]):
         """Add or update metadata for a string"""
-        self.metadata[key] = StringMetadata(key, data)
+        # Mark both the old category (before) and the new one (after), in case the string moved
+        self._mark_dirty(key)
+        self._raw[key] = data
+        self._built.pop(key, None)
+        self._mark_dirty(key)
 
     def remove_metadata(self, key: str):
         """Remove metadata for a string"""
-        if key in self.metadata:
-            del self.metadata[key]
+        if key in self._raw:
+            self._mark_dirty(key)
+            del self._raw[key]
+            self._built.pop(key, None)
+
+    def _mark_dirty(self, key: str):
+        """Record the category file currently holding a string as needing a save"""
+        data = self._raw.get(key)
+        if data is not None and self._dirty_categories is not None:
+            self._dirty_categories.add(data.get('category', '') or 'uncategorized')
 
     def list_all(self) -> List[str]:
         """Get list of all documented string keys"""
-        return sorted(self.metadata.keys())
+        return sorted(self._raw)
 
     def get_strings_from_xml(self) -> Dict[str, str]:
         """Parse strings.xml and return dict of {name: value}"""
-        if not self.strings_file.exists():
+        try:
+            stat = self.strings_file.stat()
+        except FileNotFoundError:
             print(f"✗ Strings file not found: {self.strings_file}")
             return {}
 
-        tree = ET.parse(self.strings_file)
-        root = tree.getroot()
-        strings = {}
+        # Reuse the previous parse while the file is unchanged
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if self._xml_cache is not None and self._xml_cache[0] == signature:
+            return self._xml_cache[1]
 
-        for string_elem in root.findall('.//string'):
-            name = string_elem.get('name')
-            if name:
-                text = string_elem.text or ''
-                strings[name] = text
+        strings = {}
 
+        # Stream the file instead of building the full DOM
+        if LET is not None:
+            context = LET.iterparse(str(self.strings_file), events=('end',), tag='string')
+            for _, elem in context:
+                name = elem.get('name')
+                if name:
+                    strings[name] = elem.text or ''
+                elem.clear()
+                # Drop already-processed siblings so the tree never grows
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+        else:
+            context = ET.iterparse(self.strings_file, events=('end',))
+            for _, elem in context:
+                if elem.tag == 'string':
+                    name = elem.get('name')
+                    if name:
+                        strings[name] = elem.text or ''
+                    elem.clear()
+            context.root.clear()
+
+        self._xml_cache = (signature, strings)
         return strings
 
-    def validate_consistency(self) -> List[str]:
+    def validate_consistency(self, xml_strings: Optional[Dict[str, str]] = None) -> List[str]:
         """Validate metadata is in sync with strings.xml"""
         issues = []
 
-        xml_strings = self.get_strings_from_xml()
-        xml_keys = set(xml_strings.keys())
-        meta_keys = set(self.metadata.keys())
+        if xml_strings is None:
+            xml_strings = self.get_strings_from_xml()
+        # dict key views support set operations directly, no set() copies needed
+        xml_keys = xml_strings.keys()
+        meta_keys = self._raw.keys()
 
         # Update total strings count
-        self.file_data['total_strings'] = len(xml_keys)
+        self.file_data['total_strings'] = len(xml_strings)
 
         # Find strings without metadata
         missing_metadata = xml_keys - meta_keys
         if missing_metadata:
             issues.append(f"\n⚠ {len(missing_metadata)} strings without metadata:")
-            for key in sorted(list(missing_metadata)[:10]):  # Show first 10
+            for key in heapq.nsmallest(10, missing_metadata):  # Show first 10
                 issues.append(f"  - {key}: {xml_strings[key][:50]}...")
             if len(missing_metadata) > 10:
                 issues.append(f"  ... and {len(missing_metadata) - 10} more")
@@ -232,7 +318,7 @@ class MetadataManager:
         orphaned_metadata = meta_keys - xml_keys
         if orphaned_metadata:
             issues.append(f"\n⚠ {len(orphaned_metadata)} metadata entries without strings:")
-            for key in sorted(list(orphaned_metadata)):
+            for key in sorted(orphaned_metadata):
                 issues.append(f"  - {key}")
 
         if not issues:
@@ -240,89 +326,101 @@ class MetadataManager:
 
         return issues
 
-    def export_for_ai_translation(self, target_locale: str) -> Dict[str, Any]:
+    def export_for_ai_translation(self, target_locale: str,
+                                  xml_strings: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """Export metadata in AI-friendly format for translation services"""
-        xml_strings = self.get_strings_from_xml()
+        if xml_strings is None:
+            xml_strings = self.get_strings_from_xml()
+
+        export_data = self.build_export_header(target_locale, xml_strings)
+        export_data["strings"] = list(self.iter_export_strings(xml_strings, target_locale))
+
+        return export_data
 
-        export_data = {
+    def build_export_header(self, target_locale: str, xml_strings: Dict[str, str]) -> Dict[str, Any]:
+        """Build the export envelope (everything except the strings list)"""
+        return {
             "project": "Wize SMS (DiveSMS)",
             "source_locale": "en",
             "target_locale": target_locale,
-            "export_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "export_date": datetime.now().isoformat(sep=' ', timespec='seconds'),
             "total_strings": len(xml_strings),
-            "documented_strings": len(self.metadata),
-            "strings": []
+            "documented_strings": len(self._raw)
         }
 
-        for key, meta in self.metadata.items():
-            source_text = xml_strings.get(key, '')
+    def iter_export_strings(self, xml_strings: Dict[str, str], target_locale: str) -> Iterator[Dict[str, Any]]:
+        """Yield the AI-friendly export entry for each documented string"""
+        xml_get = xml_strings.get
+        for key, data in self._raw.items():
+            # Read the raw dicts directly (same defaults as StringMetadata) and
+            # bind the nested ones once per string instead of per field
+            ui = data.get('ui', {})
+            context = data.get('context', {})
+            constraints = data.get('constraints', {})
+            guidance = data.get('translation_guidance', {})
+            technical = data.get('technical', {})
 
             # Build context description
-            ui_location = f"{meta.ui.get('screen', 'Unknown')} > {meta.ui.get('element', 'text')}"
-            if meta.ui.get('section'):
-                ui_location = f"{meta.ui.get('screen')} > {meta.ui.get('section')} > {meta.ui.get('element')}"
-
-            surrounding = []
-            if meta.context.get('surrounding_elements'):
-                surrounding = meta.context['surrounding_elements']
+            section = ui.get('section')
+            if section:
+                ui_location = f"{ui.get('screen')} > {section} > {ui.get('element')}"
+            else:
+                ui_location = f"{ui.get('screen', 'Unknown')} > {ui.get('element', 'text')}"
 
             string_data = {
                 "key": key,
-                "source_text": source_text,
+                "source_text": xml_get(key, ''),
                 "context": {
                     "ui_location": ui_location,
-                    "purpose": meta.purpose,
-                    "shown_when": meta.context.get('shown_when', ''),
-                    "surrounding_elements": surrounding,
-                    "position": meta.ui.get('position', '')
+                    "purpose": data.get('purpose', ''),
+                    "shown_when": context.get('shown_when', ''),
+                    "surrounding_elements": context.get('surrounding_elements') or [],
+                    "position": ui.get('position', '')
                 },
                 "constraints": {
-                    "max_length": meta.constraints.get('max_length'),
-                    "reason": meta.constraints.get('reason', ''),
-                    "tone": meta.translation_guidance.get('tone', 'neutral'),
-                    "style": meta.translation_guidance.get('style', 'descriptive')
+                    "max_length": constraints.get('max_length'),
+                    "reason": constraints.get('reason', ''),
+                    "tone": guidance.get('tone', 'neutral'),
+                    "style": guidance.get('style', 'descriptive')
                 },
                 "technical": {
-                    "format_specifiers": meta.technical.get('format_specifiers', False),
-                    "specifier_info": meta.technical.get('specifier_info', []),
-                    "html_formatting": meta.technical.get('html_formatting', False),
-                    "contains_emoji": meta.technical.get('contains_emoji', False),
-                    "emoji_character": meta.technical.get('emoji_character', '')
+                    "format_specifiers": technical.get('format_specifiers', False),
+                    "specifier_info": technical.get('specifier_info', []),
+                    "html_formatting": technical.get('html_formatting', False),
+                    "contains_emoji": technical.get('contains_emoji', False),
+                    "emoji_character": technical.get('emoji_character', '')
                 },
-                "terminology": meta.translation_guidance.get('terminology', {}),
-                "cultural_notes": meta.translation_guidance.get('cultural_notes', ''),
-                "category": meta.category
+                "terminology": guidance.get('terminology', {}),
+                "cultural_notes": guidance.get('cultural_notes', ''),
+                "category": data.get('category', '')
             }
-            export_data["strings"].append(string_data)
-
-        return export_data
+            yield string_data
 
-    def get_statistics(self) -> Dict[str, Any]:
+    def get_statistics(self, xml_strings: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """Get statistics about metadata coverage"""
-        xml_strings = self.get_strings_from_xml()
+        if xml_strings is None:
+            xml_strings = self.get_strings_from_xml()
         total = len(xml_strings)
-        documented = len(self.metadata)
-
-        # Count by category
-        categories = {}
-        for meta in self.metadata.values():
-            cat = meta.category
-            categories[cat] = categories.get(cat, 0) + 1
-
-        # Count technical features
-        with_format_specs = sum(1 for m in self.metadata.values()
-                               if m.technical.get('format_specifiers', False))
-        with_emoji = sum(1 for m in self.metadata.values()
-                        if m.technical.get('contains_emoji', False))
-        with_html = sum(1 for m in self.metadata.values()
-                       if m.technical.get('html_formatting', False))
+        documented = len(self._raw)
+
+        # Count categories, then tally the technical flags in one loop
+        categories = Counter(data.get('category', '') for data in self._raw.values())
+        with_format_specs = with_emoji = with_html = 0
+        for data in self._raw.values():
+            technical = data.get('technical', {})
+            if technical.get('format_specifiers'):
+                with_format_specs += 1
+            if technical.get('contains_emoji'):
+                with_emoji += 1
+            if technical.get('html_formatting'):
+                with_html += 1
 
         return {
             "total_strings": total,
             "documented_strings": documented,
             "undocumented_strings": total - documented,
             "coverage_percent": (documented / total * 100) if total > 0 else 0,
-            "categories": categories,
+            "categories": dict(categories),
             "technical_features": {
                 "format_specifiers": with_format_specs,
                 "emoji": with_emoji,
@@ -333,16 +431,18 @@ class MetadataManager:
 
 def cmd_list(manager: MetadataManager):
     """List all documented strings"""
-    print(f"\n📋 Documented Strings ({len(manager.metadata)}):")
+    keys = manager.list_all()
+    print(f"\n📋 Documented Strings ({len(keys)}):")
     print("=" * 80)
 
-    for key in manager.list_all():
+    # Build the listing once and write it in a single call instead of 3 prints per string
+    lines = []
+    append = lines.append
+    for key in keys:
         meta = manager.get_metadata(key)
         if meta:
-            desc = meta.get_short_description()
-            print(f"  {key}")
-            print(f"    {desc}")
-            print()
+            append(f"  {key}\n    {meta.get_short_description()}\n\n")
+    sys.stdout.write(''.join(lines))
 
 
 def cmd_show(manager: MetadataManager, key: str):
@@ -395,26 +495,52 @@ def cmd_validate(manager: MetadataManager):
     print("\n🔍 Validating metadata consistency...")
     print("=" * 80)
 
-    issues = manager.validate_consistency()
+    issues = manager.validate_consistency(manager.get_strings_from_xml())
     for issue in issues:
         print(issue)
 
+    manager.save()  # Save updated counts
 
-def cmd_export(manager: MetadataManager, target_locale: str):
+
+def cmd_export(manager: MetadataManager, target_locale: str, compact: bool = False, use_gzip: bool = False):
     """Export metadata for AI translation"""
     print(f"\n📤 Exporting metadata for {target_locale} translation...")
 
-    export_data = manager.export_for_ai_translation(target_locale)
+    xml_strings = manager.get_strings_from_xml()
+    header = manager.build_export_header(target_locale, xml_strings)
     output_file = f"translation_context_{target_locale}.json"
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(export_data, f, indent=2, ensure_ascii=False)
+    if use_gzip:
+        output_file += ".gz"
+        opener = partial(gzip.open, compresslevel=6)
+    else:
+        opener = open
 
-    print(f"✓ Exported {len(export_data['strings'])} strings to {output_file}")
+    # Stream the strings array one entry at a time instead of serializing the
+    # whole export at once; the output matches a single json.dump of the export.
+    if compact:
+        entry_indent, array_end = b'', b']}'
+        head = encode_json(header, compact=True)[:-1] + b',"strings":['
+    else:
+        entry_indent, array_end = b'\n    ', b'\n  ]\n}'
+        head = encode_json(header)[:-2] + b',\n  "strings": ['
+
+    count = 0
+    with opener(output_file, 'wb') as f:
+        f.write(head)
+        for entry in manager.iter_export_strings(xml_strings, target_locale):
+            if count:
+                f.write(b',')
+            # JSON strings never contain raw newlines, so this only re-indents structure
+            f.write(entry_indent + encode_json(entry, compact).replace(b'\n', b'\n    '))
+            count += 1
+        f.write(array_end if count or compact else b']\n}')
+
+    print(f"✓ Exported {count} strings to {output_file}")
     print(f"\nExport Summary:")
-    print(f"  Total strings in project: {export_data['total_strings']}")
-    print(f"  Documented strings: {export_data['documented_strings']}")
-    print(f"  Coverage: {export_data['documented_strings'] / export_data['total_strings'] * 100:.1f}%")
+    print(f"  Total strings in project: {header['total_strings']}")
+    print(f"  Documented strings: {header['documented_strings']}")
+    print(f"  Coverage: {header['documented_strings'] / header['total_strings'] * 100:.1f}%")
 
 
 def cmd_stats(manager: MetadataManager):
@@ -422,7 +548,7 @@ def cmd_stats(manager: MetadataManager):
     print("\n📊 Metadata Statistics")
     print("=" * 80)
 
-    stats = manager.get_statistics()
+    stats = manager.get_statistics(manager.get_strings_from_xml())
 
     print(f"\nOverall Coverage:")
     print(f"  Total strings: {stats['total_strings']}")
@@ -454,6 +580,8 @@ Commands:
     show <key>          Show detailed metadata for a string
     validate            Validate metadata consistency with strings.xml
     export <locale>     Export metadata for AI translation (e.g., 'zh', 'es', 'ja')
+        --compact       Write JSON without indentation
+        --gzip          Compress the export (.json.gz)
     stats               Show coverage statistics
     help                Show this help message
 
@@ -462,10 +590,46 @@ Examples:
     python manage_string_metadata.py show flat_signin_message
     python manage_string_metadata.py validate
     python manage_string_metadata.py export zh
+    python manage_string_metadata.py export zh --compact --gzip
     python manage_string_metadata.py stats
 """)
 
 
+# Command name -> handler(args, manager)
+COMMANDS = {
+    'list': lambda args, manager: cmd_list(manager),
+    'show': lambda args, manager: cmd_show(manager, args.key),
+    'validate': lambda args, manager: cmd_validate(manager),
+    'export': lambda args, manager: cmd_export(manager, args.locale, compact=args.compact, use_gzip=args.gzip),
+    'stats': lambda args, manager: cmd_stats(manager),
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser with one subcommand per command"""
+    parser = argparse.ArgumentParser(description='String Metadata Management Tool', add_help=False)
+    # Help is printed by print_usage rather than argparse
+    parser.add_argument('-h', '--help', action='store_true', help='Show this help message')
+    subparsers = parser.add_subparsers(dest='command')
+
+    subparsers.add_parser('list', help='List all documented strings')
+
+    show_parser = subparsers.add_parser('show', help='Show detailed metadata for a string')
+    show_parser.add_argument('key', help='String key')
+
+    subparsers.add_parser('validate', help='Validate metadata consistency with strings.xml')
+
+    export_parser = subparsers.add_parser('export', help='Export metadata for AI translation')
+    export_parser.add_argument('locale', help="Target locale (e.g., 'zh', 'es', 'ja')")
+    export_parser.add_argument('--compact', action='store_true', help='Write JSON without indentation')
+    export_parser.add_argument('--gzip', action='store_true', help='Compress the export (.json.gz)')
+
+    subparsers.add_parser('stats', help='Show coverage statistics')
+    subparsers.add_parser('help', help='Show this help message')
+
+    return parser
+
+
 def main():
     # File paths
     script_dir = Path(__file__).parent  # _scripts/i18n/
@@ -473,14 +637,14 @@ def main():
     metadata_file = script_dir / 'strings_metadata.json'
     strings_file = project_root / 'presentation' / 'src' / 'main' / 'res' / 'values' / 'strings.xml'
 
-    # Check command
-    if len(sys.argv) < 2:
-        print_usage()
-        return
+    # Command names are case-insensitive
+    argv = sys.argv[1:]
+    if argv:
+        argv[0] = argv[0].lower()
 
-    command = sys.argv[1].lower()
+    args = build_parser().parse_args(argv)
 
-    if command == 'help':
+    if args.help or args.command in (None, 'help'):
         print_usage()
         return
 
@@ -488,36 +652,7 @@ def main():
     manager = MetadataManager(metadata_file, strings_file)
 
     # Execute command
-    if command == 'list':
-        cmd_list(manager)
-
-    elif command == 'show':
-        if len(sys.argv) < 3:
-            print("✗ Error: Please provide a string key")
-            print("Usage: python manage_string_metadata.py show <key>")
-            return
-        key = sys.argv[2]
-        cmd_show(manager, key)
-
-    elif command == 'validate':
-        cmd_validate(manager)
-        manager.save()  # Save updated counts
-
-    elif command == 'export':
-        if len(sys.argv) < 3:
-            print("✗ Error: Please provide a target locale")
-            print("Usage: python manage_string_metadata.py export <locale>")
-            print("Examples: zh, es, ja, fr, de")
-            return
-        locale = sys.argv[2]
-        cmd_export(manager, locale)
-
-    elif command == 'stats':
-        cmd_stats(manager)
-
-    else:
-        print(f"✗ Unknown command: {command}")
-        print_usage()
+    COMMANDS[args.command](args, manager)
 
 
 if __name__ == "__main__":
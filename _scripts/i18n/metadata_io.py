@@ -10,16 +10,86 @@ that is split across multiple category-based YAML files. It handles:
 - Providing efficient access patterns (load all, load by key, load by category)
 """
 
+import copy
+import functools
 import json
+import mmap
+import os
+import pickle
+import re
 import yaml
+from collections import OrderedDict
+from operator import methodcaller
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Optional, Set, Tuple
 from datetime import datetime
 
+try:
+    # libyaml-backed loader/dumper are several times faster than the pure-Python ones
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# A top-level mapping key as written by the YAML dumper (plain scalar at column 0)
+TOP_LEVEL_KEY_PATTERN = re.compile(rb'^([A-Za-z0-9_.-]+):', re.MULTILINE)
+
+
+def _json_loads(data: bytes):
+    """Decode JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(data, compact: bool = False) -> bytes:
+    """Encode data as UTF-8 JSON (2-space indented unless compact), using orjson when available."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if compact:
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _write_atomically(path: Path, write) -> None:
+    """
+    Write a file through a temporary sibling and swap it into place.
+
+    Args:
+        path: Destination file
+        write: Callable that writes the whole payload to a binary file object
+    """
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        with open(tmp_path, 'wb', buffering=1 << 20) as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
 
 class MetadataIO:
     """Handles reading and writing split metadata files."""
 
+    __slots__ = ('i18n_dir', 'metadata_dir', 'index_path', 'defaults_path', 'bundle_path', 'cache_path',
+                 '_index', '_defaults', '_defaults_nested_keys', '_category_cache', '_key_to_category', '_all_keys',
+                 '_merged_cache', '_cat_to_keys', '_disk_cache', '_fragment_offsets', '_fragment_cache',
+                 '_has_index_file', '_available_categories')
+
+    # Parsed category files shared by all instances in the process, keyed by
+    # (path, (mtime_ns, size)) and bounded as an LRU
+    _shared_cache: "OrderedDict[Tuple[str, Tuple[int, int]], Mapping]" = OrderedDict()
+    _SHARED_CACHE_SIZE = 64
+
     def __init__(self, i18n_dir: Path, metadata_subdir: str = "metadata_divesms"):
         """
         Initialize MetadataIO.
@@ -32,38 +102,96 @@ class MetadataIO:
         self.metadata_dir = self.i18n_dir / metadata_subdir
         self.index_path = self.metadata_dir / "index.json"
         self.defaults_path = self.metadata_dir / "defaults.json"
+        # Optional prebuilt merged metadata for all categories (see build_bundle)
+        self.bundle_path = self.metadata_dir / ".metadata_bundle.json"
+        # Parsed category files persisted across runs (see _cached_category)
+        self.cache_path = self.metadata_dir / ".cache" / "categories.pkl"
 
         # Cached data
         self._index: Optional[Dict] = None
         self._defaults: Optional[Dict] = None
-        self._category_cache: Dict[str, Dict] = {}
+        self._defaults_nested_keys: frozenset = frozenset()
+        self._category_cache: Dict[str, Mapping] = {}
+        self._key_to_category: Optional[Dict[str, str]] = None
+        self._all_keys: FrozenSet[str] = frozenset()
+        # string key -> (raw metadata it was merged from, merged result), plus the
+        # keys merged per category so a save only evicts that category's entries
+        self._merged_cache: Dict[str, Tuple[Mapping, Dict]] = {}
+        self._cat_to_keys: Dict[str, Set[str]] = {}
+        # category -> ((mtime_ns, size) of the YAML file, parsed data); loaded lazily
+        self._disk_cache: Optional[Dict[str, Tuple[Tuple[int, int], Dict]]] = None
+        # category -> {string key: (start, end) byte range}, and the entries parsed
+        # from those ranges, for single-string lookups of unparsed categories
+        self._fragment_offsets: Dict[str, Dict[str, Tuple[int, int]]] = {}
+        self._fragment_cache: Dict[str, Dict[str, Mapping]] = {}
+        # Result of one directory sweep of metadata_dir (see _scan_metadata_dir)
+        self._has_index_file: bool = False
+        self._available_categories: Optional[frozenset] = None
+
+    def _scan_metadata_dir(self) -> frozenset:
+        """
+        Read metadata_dir once, noting index.json and the category YAML files on disk.
+
+        os.scandir reports each entry's file type from the directory listing itself,
+        so this needs no per-file stat calls.
+
+        Returns:
+            Names of categories that have a YAML file (empty if the directory is missing)
+        """
+        if self._available_categories is None:
+            has_index = False
+            categories = set()
+            try:
+                with os.scandir(self.metadata_dir) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if name == "index.json":
+                            has_index = entry.is_file()
+                        elif name.endswith('.yaml') and entry.is_file(follow_symlinks=False):
+                            categories.add(name[:-5])
+            except OSError:
+                pass
+            self._has_index_file = has_index
+            self._available_categories = frozenset(categories)
+        return self._available_categories
 
     def _load_index(self) -> Dict:
         """Load index.json (string key → category mapping)."""
         if self._index is None:
-            if not self.index_path.exists():
-                raise FileNotFoundError(f"Index file not found: {self.index_path}")
-
-            with open(self.index_path, 'r', encoding='utf-8') as f:
-                self._index = json.load(f)
+            try:
+                self._index = _json_loads(self.index_path.read_bytes())
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Index file not found: {self.index_path}") from None
+
+            # Reverse map for O(1) key lookups; the first category listing a key wins
+            key_to_category = {}
+            for category, keys in self._index.get('categories', {}).items():
+                for key in keys:
+                    key_to_category.setdefault(key, category)
+            self._key_to_category = key_to_category
+            self._all_keys = frozenset(key_to_category)
 
         return self._index
 
     def _load_defaults(self) -> Dict:
         """Load defaults.json."""
         if self._defaults is None:
-            if not self.defaults_path.exists():
+            try:
+                data = _json_loads(self.defaults_path.read_bytes())
+                # Extract the nested "defaults" object
+                self._defaults = data.get('defaults', {})
+            except FileNotFoundError:
                 # Return empty defaults if file doesn't exist yet
                 self._defaults = {}
-            else:
-                with open(self.defaults_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    # Extract the nested "defaults" object
-                    self._defaults = data.get('defaults', {})
+
+            # Defaults that are deep-merged rather than overridden, computed once
+            self._defaults_nested_keys = frozenset(
+                key for key, value in self._defaults.items() if isinstance(value, dict)
+            )
 
         return self._defaults
 
-    def _load_category_file(self, category: str) -> Dict:
+    def _load_category_file(self, category: str) -> Mapping:
         """
         Load a category YAML file.
 
@@ -71,50 +199,172 @@ class MetadataIO:
             category: Category name (e.g., 'authentication', 'trading')
 
         Returns:
-            Dictionary of string metadata for this category
+            Read-only mapping of string metadata for this category
         """
         if category in self._category_cache:
             return self._category_cache[category]
 
+        category_data = self._cached_category(category)
+        if category_data is None:
+            # Persisted with the next batch load (see _load_categories), not rewritten per file
+            signature, raw_data = self._read_category_file(category)
+            category_data = self._remember_category(category, signature, raw_data)
+
+        self._category_cache[category] = category_data
+        return category_data
+
+    def _cached_category(self, category: str) -> Optional[Mapping]:
+        """
+        Get a category from the process-wide or on-disk cache if its YAML file is unchanged.
+
+        Args:
+            category: Category name
+
+        Returns:
+            Frozen category data (see _freeze_category), or None if not cached
+            or the file changed
+        """
         category_path = self.metadata_dir / f"{category}.yaml"
+        try:
+            stat = category_path.stat()
+        except OSError:
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        # Another instance in this process may already have parsed it
+        shared_key = (str(category_path), signature)
+        category_data = MetadataIO._shared_cache.get(shared_key)
+        if category_data is not None:
+            MetadataIO._shared_cache.move_to_end(shared_key)
+            return category_data
+
+        if self._disk_cache is None:
+            try:
+                cache = pickle.loads(self.cache_path.read_bytes())
+            except Exception:
+                cache = None
+            self._disk_cache = cache if isinstance(cache, dict) else {}
+
+        entry = self._disk_cache.get(category)
+        if entry is None or entry[0] != signature:
+            return None
 
-        if not category_path.exists():
-            raise FileNotFoundError(f"Category file not found: {category_path}")
+        category_data = self._freeze_category(entry[1])
+        self._share_category(shared_key, category_data)
+        return category_data
 
-        with open(category_path, 'r', encoding='utf-8') as f:
-            category_data = yaml.safe_load(f) or {}
+    def _remember_category(self, category: str, signature: Tuple[int, int], raw_data: Dict) -> Mapping:
+        """
+        Record a freshly parsed category in the on-disk and process-wide caches.
 
-        self._category_cache[category] = category_data
+        Returns:
+            The frozen category data to use in memory
+        """
+        if self._disk_cache is None:
+            self._disk_cache = {}
+        # The pickle keeps plain dicts; mappingproxy objects can't be pickled
+        self._disk_cache[category] = (signature, raw_data)
+        category_data = self._freeze_category(raw_data)
+        self._share_category((str(self.metadata_dir / f"{category}.yaml"), signature), category_data)
         return category_data
 
-    def _merge_with_defaults(self, metadata: Dict) -> Dict:
+    @staticmethod
+    def _freeze_category(raw_data: Dict) -> Mapping:
+        """
+        Wrap category data in read-only views so cached data can be shared by reference.
+
+        The category mapping and each string's metadata mapping become
+        MappingProxyType views. Nested values (ui, context, ...) stay plain dicts
+        so they can be serialized; _merge_with_defaults copies them before they
+        reach callers.
+        """
+        return MappingProxyType({
+            key: MappingProxyType(value) if isinstance(value, dict) else value
+            for key, value in raw_data.items()
+        })
+
+    @classmethod
+    def _share_category(cls, shared_key: Tuple[str, Tuple[int, int]], category_data: Dict) -> None:
+        """Insert into the process-wide category cache, evicting the least recently used."""
+        cls._shared_cache[shared_key] = category_data
+        cls._shared_cache.move_to_end(shared_key)
+        while len(cls._shared_cache) > cls._SHARED_CACHE_SIZE:
+            cls._shared_cache.popitem(last=False)
+
+    def _save_disk_cache(self) -> None:
+        """Persist parsed categories for later runs (best effort), dropping deleted categories."""
+        available = self._scan_metadata_dir()
+        self._disk_cache = {
+            category: entry for category, entry in self._disk_cache.items() if category in available
+        }
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            _write_atomically(self.cache_path, functools.partial(
+                pickle.dump, self._disk_cache, protocol=pickle.HIGHEST_PROTOCOL))
+        except OSError:
+            pass
+
+    def _read_category_file(self, category: str) -> Tuple[Tuple[int, int], Dict]:
+        """
+        Parse a category YAML file without touching the caches; callers store the result.
+
+        Args:
+            category: Category name
+
+        Returns:
+            The file's (mtime_ns, size) signature taken before parsing, and the
+            dictionary of string metadata for this category
+        """
+        category_path = self.metadata_dir / f"{category}.yaml"
+
+        # Binary mode: libyaml decodes UTF-8 itself, skipping the text-layer decode
+        try:
+            f = open(category_path, 'rb')
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Category file not found: {category_path}") from None
+
+        with f:
+            stat = os.fstat(f.fileno())
+            return (stat.st_mtime_ns, stat.st_size), yaml.load(f, Loader=SafeLoader) or {}
+
+    def _merge_with_defaults(self, category: str, string_key: str, metadata: Mapping) -> Dict:
         """
         Merge string metadata with defaults.
 
         Args:
+            category: Category the string belongs to
+            string_key: String resource key
             metadata: String-specific metadata
 
         Returns:
-            Merged metadata with defaults applied
+            Merged metadata with defaults applied. The result is cached and shared
+            between calls, so callers must treat it as read-only.
         """
+        cached = self._merged_cache.get(string_key)
+        if cached is not None and cached[0] is metadata:
+            return cached[1]
+
         defaults = self._load_defaults()
-        merged = {}
-
-        # Deep merge defaults with metadata
-        # Metadata values override defaults
-        for key, default_value in defaults.items():
-            if isinstance(default_value, dict):
-                # Deep merge for nested dictionaries
-                merged[key] = {**default_value, **metadata.get(key, {})}
+        nested_keys = self._defaults_nested_keys
+
+        # Start from a C-level copy of the defaults, then copy only the nested
+        # dicts that get merged into
+        merged = defaults.copy()
+        for key in nested_keys:
+            merged[key] = defaults[key].copy()
+
+        # Metadata values override defaults; nested dictionaries are deep-merged.
+        # Keys not in defaults are appended in metadata order. The entry is deep-copied
+        # first: its nested dicts belong to the cache shared by every instance.
+        for key, value in copy.deepcopy(dict(metadata)).items():
+            if key in nested_keys:
+                if value:
+                    merged[key].update(value)
             else:
-                # Use metadata value if exists, otherwise default
-                merged[key] = metadata.get(key, default_value)
-
-        # Add any keys in metadata that aren't in defaults
-        for key, value in metadata.items():
-            if key not in merged:
                 merged[key] = value
 
+        self._merged_cache[string_key] = (metadata, merged)
+        self._cat_to_keys.setdefault(category, set()).add(string_key)
         return merged
 
     def get_string_metadata(self, string_key: str) -> Optional[Dict]:
@@ -127,29 +377,83 @@ class MetadataIO:
         Returns:
             Metadata dictionary with defaults merged, or None if not found
         """
-        index = self._load_index()
+        self._load_index()
 
         # Find category for this string
-        category = None
-        for cat, keys in index.get('categories', {}).items():
-            if string_key in keys:
-                category = cat
-                break
+        category = self._key_to_category.get(string_key)
 
         if category is None:
             return None
 
-        # Load category file
-        category_data = self._load_category_file(category)
-
-        # Get string metadata
-        string_metadata = category_data.get(string_key)
+        # Use the whole category if it is already loaded or cached
+        category_data = self._category_cache.get(category)
+        if category_data is None:
+            category_data = self._cached_category(category)
+            if category_data is not None:
+                self._category_cache[category] = category_data
+
+        # Get string metadata, parsing only this string's entry if possible
+        if category_data is not None:
+            string_metadata = category_data.get(string_key)
+        else:
+            string_metadata = self._read_string_fragment(category, string_key)
+            if string_metadata is None:
+                string_metadata = self._load_category_file(category).get(string_key)
 
         if string_metadata is None:
             return None
 
         # Merge with defaults
-        return self._merge_with_defaults(string_metadata)
+        return self._merge_with_defaults(category, string_key, string_metadata)
+
+    def _read_string_fragment(self, category: str, string_key: str) -> Optional[Mapping]:
+        """
+        Parse a single string's entry from a category file without parsing the rest.
+
+        The first lookup in a category records the byte range of every top-level
+        key; later lookups slice the file and parse just that range.
+
+        Args:
+            category: Category name
+            string_key: String resource key
+
+        Returns:
+            Read-only string metadata, or None if the entry can't be isolated
+            (callers then fall back to parsing the whole file)
+        """
+        fragments = self._fragment_cache.setdefault(category, {})
+        if string_key in fragments:
+            return fragments[string_key]
+
+        category_path = self.metadata_dir / f"{category}.yaml"
+        try:
+            with open(category_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                offsets = self._fragment_offsets.get(category)
+                if offsets is None:
+                    starts = [(match.start(), match.group(1).decode('ascii'))
+                              for match in TOP_LEVEL_KEY_PATTERN.finditer(mm)]
+                    ends = [start for start, _ in starts[1:]] + [len(mm)]
+                    # Later duplicates win, as they do in a full YAML load
+                    offsets = {key: (start, end) for (start, key), end in zip(starts, ends)}
+                    self._fragment_offsets[category] = offsets
+
+                span = offsets.get(string_key)
+                if span is None:
+                    return None
+                fragment = mm[span[0]:span[1]]
+        except (OSError, ValueError):
+            return None
+
+        try:
+            data = yaml.load(fragment, Loader=SafeLoader)
+        except yaml.YAMLError:
+            return None
+        if not isinstance(data, dict) or list(data) != [string_key] or not isinstance(data[string_key], dict):
+            return None
+
+        string_metadata = MappingProxyType(data[string_key])
+        fragments[string_key] = string_metadata
+        return string_metadata
 
     def get_category_metadata(self, category: str) -> Dict[str, Dict]:
         """
@@ -166,7 +470,7 @@ class MetadataIO:
         # Merge defaults for each string
         result = {}
         for string_key, metadata in category_data.items():
-            result[string_key] = self._merge_with_defaults(metadata)
+            result[string_key] = self._merge_with_defaults(category, string_key, metadata)
 
         return result
 
@@ -178,29 +482,126 @@ class MetadataIO:
             Dictionary mapping string keys to their metadata (with defaults merged)
         """
         index = self._load_index()
-        all_metadata = {}
+        categories = list(index.get('categories', {}).keys())
+
+        # A fresh bundle already holds the merged result: one read, no YAML parsing
+        bundle = self._load_bundle(categories)
+        if bundle is not None:
+            return bundle
 
-        # Load each category
-        for category in index.get('categories', {}).keys():
+        return self._merge_all_categories(categories)
+
+    def _merge_all_categories(self, categories: List[str]) -> Dict[str, Dict]:
+        """
+        Load and merge the given categories from their YAML files.
+
+        Args:
+            categories: Category names, in index order
+
+        Returns:
+            Dictionary mapping string keys to their metadata (with defaults merged)
+        """
+        self._load_categories(categories)
+
+        # Merge each category in index order
+        all_metadata = {}
+        for category in categories:
             category_metadata = self.get_category_metadata(category)
             all_metadata.update(category_metadata)
 
         return all_metadata
 
-    def get_all_string_keys(self) -> Set[str]:
+    def _load_categories(self, categories: List[str]) -> None:
         """
-        Get all string keys across all categories.
+        Bring several category files into the in-memory cache.
+
+        Unchanged categories come from the on-disk cache and the rest are parsed.
+
+        Args:
+            categories: Category names
+        """
+        missing = []
+        for category in categories:
+            if category in self._category_cache:
+                continue
+            category_data = self._cached_category(category)
+            if category_data is None:
+                missing.append(category)
+            else:
+                self._category_cache[category] = category_data
+
+        for category in missing:
+            signature, raw_data = self._read_category_file(category)
+            self._category_cache[category] = self._remember_category(category, signature, raw_data)
+        if missing:
+            self._save_disk_cache()
+
+    def _load_bundle(self, categories: List[str]) -> Optional[Dict[str, Dict]]:
+        """
+        Load the metadata bundle if it is newer than every file it was built from.
+
+        Args:
+            categories: Category names from the index
+
+        Returns:
+            Merged metadata for all strings, or None if the bundle is missing or stale
+        """
+        try:
+            bundle_mtime = self.bundle_path.stat().st_mtime_ns
+            sources = [self.index_path] + [self.metadata_dir / f"{category}.yaml" for category in categories]
+            if any(path.stat().st_mtime_ns >= bundle_mtime for path in sources):
+                return None
+            try:
+                if self.defaults_path.stat().st_mtime_ns >= bundle_mtime:
+                    return None
+            except FileNotFoundError:
+                pass
+            return _json_loads(self.bundle_path.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def build_bundle(self) -> Path:
+        """
+        Write the merged metadata of all categories to the bundle file.
+
+        While the bundle is newer than the index, defaults and category files,
+        get_all_metadata() returns it instead of parsing every YAML file.
 
         Returns:
-            Set of all string keys
+            Path to the written bundle
         """
         index = self._load_index()
-        all_keys = set()
+        categories = list(index.get('categories', {}).keys())
+        payload = _json_dumps(self._merge_all_categories(categories), compact=True)
+        _write_atomically(self.bundle_path, methodcaller('write', payload))
+        return self.bundle_path
+
+    def get_all_string_keys(self) -> FrozenSet[str]:
+        """
+        Get all string keys across all categories.
+
+        Returns:
+            Immutable set of all string keys, shared between calls; use
+            set(io.get_all_string_keys()) for a copy that can be modified
+        """
+        # The union is computed once when the index is loaded
+        self._load_index()
+        return self._all_keys
+
+    def get_category_keys(self, categories: List[str]) -> Dict[str, List[str]]:
+        """
+        Get the string keys defined in each category file, without consulting the index.
 
-        for keys in index.get('categories', {}).values():
-            all_keys.update(keys)
+        Unchanged files are taken from the parsed-category cache instead of being re-parsed.
 
-        return all_keys
+        Args:
+            categories: Category names (one YAML file each)
+
+        Returns:
+            Dictionary mapping each category to its sorted string keys
+        """
+        self._load_categories(categories)
+        return {category: sorted(self._load_category_file(category)) for category in categories}
 
     def get_categories(self) -> List[str]:
         """
@@ -212,6 +613,15 @@ class MetadataIO:
         index = self._load_index()
         return list(index.get('categories', {}).keys())
 
+    def get_available_categories(self) -> List[str]:
+        """
+        Get the categories that have a YAML file on disk, without consulting the index.
+
+        Returns:
+            Sorted list of category names (empty if the metadata directory is missing)
+        """
+        return sorted(self._scan_metadata_dir())
+
     def get_metadata_version(self) -> str:
         """Get metadata version from index."""
         index = self._load_index()
@@ -239,18 +649,26 @@ class MetadataIO:
 
         # Ensure metadata directory exists
         self.metadata_dir.mkdir(parents=True, exist_ok=True)
+        self._available_categories = None
 
-        # Write YAML
-        with open(category_path, 'w', encoding='utf-8') as f:
-            yaml.dump(data, f, default_flow_style=False, allow_unicode=True, sort_keys=True)
+        # Write YAML (encoded by the dumper, so the many small chunks it emits
+        # are batched by the binary buffer)
+        _write_atomically(category_path, functools.partial(
+            yaml.dump, data, Dumper=SafeDumper, default_flow_style=False, allow_unicode=True, sort_keys=True,
+            encoding='utf-8'))
 
         # Clear cache
-        if category in self._category_cache:
-            del self._category_cache[category]
+        if self._disk_cache is not None:
+            self._disk_cache.pop(category, None)
+        self._fragment_offsets.pop(category, None)
+        self._fragment_cache.pop(category, None)
+        self._category_cache.pop(category, None)
+        for string_key in self._cat_to_keys.pop(category, ()):
+            self._merged_cache.pop(string_key, None)
 
     def save_index(self, index_data: Dict) -> None:
         """
-        Save index.json.
+        Save index.json and rebuild the metadata bundle (see build_bundle).
 
         Args:
             index_data: Complete index dictionary
@@ -260,13 +678,23 @@ class MetadataIO:
 
         # Ensure metadata directory exists
         self.metadata_dir.mkdir(parents=True, exist_ok=True)
+        self._available_categories = None
 
         # Write JSON
-        with open(self.index_path, 'w', encoding='utf-8') as f:
-            json.dump(index_data, f, indent=2, ensure_ascii=False)
+        payload = _json_dumps(index_data)
+        _write_atomically(self.index_path, methodcaller('write', payload))
 
         # Clear cache
         self._index = None
+        self._key_to_category = None
+        self._all_keys = frozenset()
+
+        # Category files are saved before the index, so the bundle can be rebuilt now.
+        # If that fails, remove it; get_all_metadata() then parses the YAML files.
+        try:
+            self.build_bundle()
+        except (OSError, yaml.YAMLError):
+            self.bundle_path.unlink(missing_ok=True)
 
     def save_defaults(self, defaults_data: Dict) -> None:
         """
@@ -277,17 +705,21 @@ class MetadataIO:
         """
         # Ensure metadata directory exists
         self.metadata_dir.mkdir(parents=True, exist_ok=True)
+        self._available_categories = None
 
         # Write JSON
-        with open(self.defaults_path, 'w', encoding='utf-8') as f:
-            json.dump(defaults_data, f, indent=2, ensure_ascii=False)
+        payload = _json_dumps(defaults_data)
+        _write_atomically(self.defaults_path, methodcaller('write', payload))
 
-        # Clear cache
+        # Clear cache (every merged result depends on the defaults)
         self._defaults = None
+        self._merged_cache.clear()
+        self._cat_to_keys.clear()
 
     def is_split_format(self) -> bool:
         """Check if split metadata format exists."""
-        return self.metadata_dir.exists() and self.index_path.exists()
+        self._scan_metadata_dir()
+        return self._has_index_file
 
     def is_legacy_format(self) -> bool:
         """Check if legacy strings_metadata.json exists."""
@@ -304,13 +736,25 @@ def create_metadata_io(i18n_dir: Optional[Path] = None, metadata_subdir: str = "
         metadata_subdir: Name of metadata subdirectory (default: 'metadata_divesms')
 
     Returns:
-        MetadataIO instance
+        MetadataIO instance, shared by all callers asking for the same directory.
+        Call clear_metadata_io_cache() after changing metadata files outside it.
     """
     if i18n_dir is None:
         # Auto-detect: assume this script is in _scripts/i18n/
         i18n_dir = Path(__file__).parent
 
-    return MetadataIO(i18n_dir, metadata_subdir)
+    return _cached_metadata_io(str(i18n_dir), metadata_subdir)
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_metadata_io(i18n_dir: str, metadata_subdir: str) -> MetadataIO:
+    """Create one MetadataIO per (i18n_dir, metadata_subdir)."""
+    return MetadataIO(Path(i18n_dir), metadata_subdir)
+
+
+def clear_metadata_io_cache() -> None:
+    """Forget the instances handed out by create_metadata_io()."""
+    _cached_metadata_io.cache_clear()
 
 
 if __name__ == '__main__':
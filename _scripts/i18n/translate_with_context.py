@@ -2,7 +2,7 @@
 """
 AI Translation with Context - Universal String Translation System for DiveSMS
 
-Multi-language translation using structured output - translates one string
+Multi-language translation using structured output - translates a few strings
 to all 21 languages in a single API call for efficiency.
 
 Usage:
@@ -23,28 +23,62 @@ Requirements:
     - Install: pip install openai anthropic pyyaml
 """
 
+import argparse
+import asyncio
+import atexit
+import hashlib
+import importlib.util
 import json
 import sys
 import os
+import queue
 import re
+import sqlite3
+import time
 import xml.etree.ElementTree as ET
 import logging
 import traceback
+from logging.handlers import QueueHandler, QueueListener
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 from datetime import datetime
-from metadata_io import create_metadata_io, MetadataIO
 
-# Setup logging
+if TYPE_CHECKING:
+    # Imported lazily at runtime (pulls in PyYAML), only when split metadata exists
+    from metadata_io import MetadataIO
+
+try:
+    # lxml parses and serializes in C, much faster than ElementTree on large strings.xml files
+    from lxml import etree as LET
+except ImportError:
+    LET = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# HTTP/2 lets concurrent API requests share one connection; httpx needs the optional h2 package for it
+HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+# Setup logging: records are queued and written to the log file and stdout by a
+# background thread, so translation work never waits on log I/O
 log_file = Path(__file__).parent / f"translation_errors_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(message)s',
-    handlers=[
-        logging.FileHandler(log_file, encoding='utf-8'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+log_handlers = [
+    logging.FileHandler(log_file, encoding='utf-8'),
+    logging.StreamHandler(sys.stdout)
+]
+for log_handler in log_handlers:
+    log_handler.setFormatter(logging.Formatter('%(asctime)s [%(levelname)s] %(message)s'))
+log_queue = queue.SimpleQueue()
+log_listener = QueueListener(log_queue, *log_handlers)
+log_listener.start()
+atexit.register(log_listener.stop)  # Writes out queued records on exit
+queue_handler = QueueHandler(log_queue)
+queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
 logger = logging.getLogger(__name__)
 
 
@@ -66,6 +100,67 @@ AI_PROVIDER = os.getenv('AI_TRANSLATION_PROVIDER', 'openai')
 OPENAI_MODEL = 'gpt-4o'
 ANTHROPIC_MODEL = 'claude-3-opus-20240229'
 
+# Maximum number of translation requests in flight at once (keep within your OpenAI rate-limit tier)
+TRANSLATION_CONCURRENCY = max(1, int(os.getenv('TRANSLATION_CONCURRENCY', '10')))
+
+# Retries for rate limits (429), connection errors and 5xx responses
+OPENAI_MAX_ATTEMPTS = 6
+OPENAI_RETRY_INITIAL_SECONDS = 2
+OPENAI_RETRY_MAX_SECONDS = 60
+
+# Client-side pacing per provider: (requests per minute, prompt tokens per minute).
+# Override with TRANSLATION_RPM / TRANSLATION_TPM; 0 disables a limit.
+RATE_LIMIT_PROFILES = {
+    'openai': (60, 150_000),
+    'anthropic': (50, 80_000),
+}
+
+# Strings packed into one chat completion request (1 = one request per string)
+STRINGS_PER_REQUEST = max(1, int(os.getenv('TRANSLATION_STRINGS_PER_REQUEST', '5')))
+
+# Output token budget per string in a request (translations for all target languages)
+MAX_COMPLETION_TOKENS_PER_STRING = 2000
+
+# Output token limit of OPENAI_MODEL; requests hold fewer strings if their budgets would exceed it
+MAX_COMPLETION_TOKENS_PER_REQUEST = 16384
+
+# OpenAI Batch API (--batch): half price, results returned within the completion window
+BATCH_COMPLETION_WINDOW = '24h'
+BATCH_POLL_INITIAL_SECONDS = 10
+BATCH_POLL_MAX_SECONDS = 300
+BATCH_FINAL_STATUSES = {'completed', 'failed', 'expired', 'cancelled'}
+
+# Translation cache: finished translations keyed by a hash of the full API request
+TRANSLATION_CACHE_FILE = '.translation_cache.db'
+# Cached translations written per transaction (the rest are committed when the cache is closed)
+CACHE_COMMIT_INTERVAL = 20
+
+# Android strings.xml
+TOOLS_NAMESPACE = 'http://schemas.android.com/tools'
+XML_DECLARATION = b'<?xml version="1.0" encoding="utf-8"?>\n'
+XML_WRITE_BUFFER_SIZE = 1 << 16
+
+# Characters escape_android_string backslash-escapes (translated in one pass)
+ANDROID_ESCAPE_TABLE = str.maketrans({'\\': '\\\\', "'": "\\'", '"': '\\"'})
+
+# Placeholders that need formatted="false" to keep Android lint quiet
+CUSTOM_PLACEHOLDER_PATTERN = re.compile(r'%\w+%')  # %variableName%
+ANDROID_SPECIFIER_PATTERN = re.compile(r'%[sdifgeoxX]')  # %s, %d, %f, etc.
+
+# Metadata fields rendered by MultiLanguageTranslator.metadata_context (others, e.g. references, are ignored)
+CONTEXT_METADATA_FIELDS = ('category', 'ui', 'context', 'purpose', 'constraints', 'translation_guidance', 'technical')
+
+# Shared by single- and multi-string prompts
+TRANSLATION_REQUIREMENTS = """Requirements:
+1. Translate naturally for native speakers
+2. Maintain exact same meaning and intent
+3. Respect all technical constraints (format specifiers, HTML, emoji)
+4. Stay within length limits (CRITICAL for UI fit)
+5. Match specified tone and style
+6. Use appropriate domain terminology
+7. Adapt culturally while preserving meaning
+"""
+
 # Supported languages
 ALL_LANGUAGES = [
     "en", "zh-CN", "zh-TW", "hi", "es", "ar", "pt-BR", "id",
@@ -121,6 +216,20 @@ LOCALE_NAMES = {
 }
 
 
+def _json_loads(data):
+    """Decode JSON from str or bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(data) -> str:
+    """Encode data as compact JSON (no indentation or spaces), using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data).decode('utf-8')
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False)
+
+
 def escape_android_string(text: str) -> str:
     r"""
     Escape special characters for Android XML string resources.
@@ -139,45 +248,369 @@ def escape_android_string(text: str) -> str:
     if not text:
         return text
 
-    # Escape backslashes first (must be done before other escapes)
-    text = text.replace('\\', '\\\\')
-
-    # Escape apostrophes
-    text = text.replace("'", "\\'")
-
-    # Escape quotes
-    text = text.replace('"', '\\"')
+    # Escape backslashes, apostrophes and quotes in a single pass
+    text = text.translate(ANDROID_ESCAPE_TABLE)
 
     # Escape @ and ? at the start
-    if text.startswith('@'):
-        text = '\\' + text
-    elif text.startswith('?'):
+    if text[0] in '@?':
         text = '\\' + text
 
     return text
 
 
+def iter_string_elements(path: Path) -> Iterator:
+    """
+    Stream every <string> element of a strings.xml file without building the full DOM.
+
+    Each element is cleared once the consumer moves on to the next one.
+    """
+    if LET is not None:
+        context = LET.iterparse(str(path), events=('end',), tag='string', huge_tree=True, remove_blank_text=True)
+        for _, elem in context:
+            yield elem
+            elem.clear()
+            # Drop already-processed siblings so the tree never grows
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+    else:
+        context = ET.iterparse(path, events=('end',))
+        for _, elem in context:
+            if elem.tag == 'string':
+                yield elem
+                elem.clear()
+        context.root.clear()
+
+
+def iter_strings_xml(path: Path) -> Iterator[Tuple[Optional[str], Optional[str]]]:
+    """Stream (name, text) for every <string> in a strings.xml file"""
+    for elem in iter_string_elements(path):
+        yield elem.get('name'), elem.text
+
+
+def read_strings_xml(path: Path, skip_empty: bool = False) -> Dict[str, str]:
+    """Read {name: text} for every <string> in a strings.xml file"""
+    if skip_empty:
+        return {name: text for name, text in iter_strings_xml(path) if name and text}
+    return {name: text or '' for name, text in iter_strings_xml(path) if name}
+
+
+def write_strings_xml(path: Path, strings: Iterable[Tuple[str, str, bool]]) -> None:
+    """
+    Write an indented translated strings.xml from (name, escaped text, unformatted) entries.
+
+    Entries flagged unformatted get formatted="false". The file is written to a hidden
+    temporary sibling and swapped into place, so an interrupted save never leaves a
+    truncated strings.xml behind.
+    """
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        with open(tmp_path, 'wb', buffering=XML_WRITE_BUFFER_SIZE) as f:
+            f.write(XML_DECLARATION)
+            _write_resources(f, strings)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _write_resources(f, strings: Iterable[Tuple[str, str, bool]]) -> None:
+    """Write the <resources> element of a strings.xml to a binary file (see write_strings_xml)"""
+    if LET is not None:
+        # Each <string> is serialized and written as it comes, without building the document tree
+        with LET.xmlfile(f, encoding='utf-8') as xf:
+            with xf.element('resources', {f'{{{TOOLS_NAMESPACE}}}ignore': 'MissingTranslation'},
+                            nsmap={'tools': TOOLS_NAMESPACE}):
+                for name, text, unformatted in strings:
+                    string_elem = LET.Element('string', name=name)
+                    if unformatted:
+                        string_elem.set('formatted', 'false')
+                    string_elem.text = text
+                    xf.write('\n  ', string_elem)
+                xf.write('\n')
+        f.write(b'\n')
+        return
+
+    root = ET.Element('resources')
+    root.set('xmlns:tools', TOOLS_NAMESPACE)
+    root.set('tools:ignore', 'MissingTranslation')
+    for name, text, unformatted in strings:
+        string_elem = ET.SubElement(root, 'string', name=name)
+        if unformatted:
+            string_elem.set('formatted', 'false')
+        string_elem.text = text
+    ET.indent(root, space='  ')
+    # Empty strings as <string ...></string>, the way lxml's xmlfile writes them
+    f.write(ET.tostring(root, encoding='utf-8', short_empty_elements=False))
+    f.write(b'\n')
+
+
+class RateLimiter:
+    """
+    Paces concurrent API requests to stay clear of provider rate limits.
+
+    Requests and their estimated prompt tokens are counted over a sliding one-minute
+    window. The number of requests in flight adapts AIMD-style: halved on a rate-limit
+    error, raised by one after each success, up to max_concurrency.
+    Must be created inside the event loop that uses it.
+    """
+
+    WINDOW_SECONDS = 60
+
+    def __init__(self, max_concurrency: int, requests_per_minute: int = 0, tokens_per_minute: int = 0):
+        self.max_concurrency = max_concurrency
+        self.concurrency = float(max_concurrency)
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.in_flight = 0
+        self._slots = asyncio.Condition()
+        self._window_lock = asyncio.Lock()
+        self._window = deque()  # (monotonic time, estimated tokens) of recent requests
+        self._window_tokens = 0
+
+    async def acquire(self):
+        """Wait for a concurrency slot"""
+        async with self._slots:
+            await self._slots.wait_for(lambda: self.in_flight < int(self.concurrency))
+            self.in_flight += 1
+
+    async def release(self, succeeded: bool):
+        """Free a concurrency slot; a success allows one more request in flight"""
+        async with self._slots:
+            self.in_flight -= 1
+            if succeeded:
+                self.concurrency = min(self.max_concurrency, self.concurrency + 1)
+            self._slots.notify_all()
+
+    def throttled(self):
+        """Halve the requests allowed in flight after a rate-limit error"""
+        self.concurrency = max(1.0, self.concurrency / 2)
+
+    async def wait_for_capacity(self, tokens: int):
+        """Wait until one more request of ~tokens fits in the per-minute limits, then count it"""
+        async with self._window_lock:
+            while True:
+                now = time.monotonic()
+                while self._window and now - self._window[0][0] >= self.WINDOW_SECONDS:
+                    self._window_tokens -= self._window.popleft()[1]
+
+                full = (
+                    (self.requests_per_minute and len(self._window) >= self.requests_per_minute)
+                    or (self.tokens_per_minute and self._window
+                        and self._window_tokens + tokens > self.tokens_per_minute)
+                )
+                if not full:
+                    break
+                await asyncio.sleep(self._window[0][0] + self.WINDOW_SECONDS - now)
+
+            self._window.append((now, tokens))
+            self._window_tokens += tokens
+
+
 class MultiLanguageTranslator:
     """Translates strings to multiple languages using AI with structured output"""
 
-    def __init__(self, metadata_file: Path, strings_file: Path, target_languages: List[str], metadata_subdir: str = "metadata_divesms"):
+    def __init__(self, metadata_file: Path, strings_file: Path, target_languages: List[str], metadata_subdir: str = "metadata_divesms",
+                 use_cache: bool = True, provider: str = AI_PROVIDER, concurrency: int = TRANSLATION_CONCURRENCY):
         self.metadata_file = metadata_file
         self.strings_file = strings_file
         self.target_languages = target_languages
         self.metadata_subdir = metadata_subdir
+        self.provider = provider
+        self.concurrency = max(1, concurrency)  # Max translation requests in flight
         self.metadata = {}
         self.strings = {}
+        self.untranslatable: Set[str] = set()  # Source strings marked translatable="false"
         self.existing_translations = {}  # Track what's already translated
+        self.pending_languages: Dict[str, Tuple[str, ...]] = {}  # Resume: languages a string still needs
+        self._openai_client = None  # Created on first use, shared by all requests, closed by _run_async
+        self._rate_limiter: Optional[RateLimiter] = None  # Paces requests during _run_batch
+        self._language_pieces: Dict[Tuple[str, ...], Dict] = {}  # See language_pieces
+        self._context_blocks: Dict[str, str] = {}  # See metadata_context
+        self._cache_keys: Dict[Tuple[str, Tuple[str, ...]], str] = {}  # See cache_key
+        # Parsed locale strings.xml files: {path: ((mtime_ns, size), {name: escaped text})}
+        self._locale_state: Dict[Path, Tuple[Tuple[int, int], Dict[str, str]]] = {}
 
         # Initialize metadata_io for split format
-        self.metadata_io: Optional[MetadataIO] = None
+        self.metadata_io: Optional["MetadataIO"] = None
         i18n_dir = metadata_file.parent
         metadata_dir_path = i18n_dir / metadata_subdir
         if metadata_dir_path.exists():
+            from metadata_io import create_metadata_io
             self.metadata_io = create_metadata_io(i18n_dir, metadata_subdir)
 
+        # On-disk translation cache (see cache_key)
+        self.cache_path = i18n_dir / TRANSLATION_CACHE_FILE
+        self._cache: Optional[sqlite3.Connection] = None
+        self._uncommitted = 0  # Cached translations not yet committed
+        if use_cache:
+            self.open_cache()
+
         self.load_data()
 
+    def open_cache(self):
+        """Open the on-disk translation cache, creating it if needed"""
+        try:
+            self._cache = sqlite3.connect(self.cache_path)
+            self._cache.execute("PRAGMA journal_mode=WAL")
+            # WAL stays consistent without an fsync per commit; a crash loses at most the last commits
+            self._cache.execute("PRAGMA synchronous=NORMAL")
+            self._cache.execute(
+                "CREATE TABLE IF NOT EXISTS translations (key TEXT PRIMARY KEY, translations TEXT NOT NULL)"
+            )
+            # Source hash each saved translation was made from (see source_hash)
+            self._cache.execute(
+                "CREATE TABLE IF NOT EXISTS sources (string_key TEXT NOT NULL, locale TEXT NOT NULL, "
+                "source_hash TEXT NOT NULL, PRIMARY KEY (string_key, locale))"
+            )
+            self._cache.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"⚠ Translation cache unavailable, continuing without it: {e}")
+            logger.debug(traceback.format_exc())
+            self._cache = None
+
+    def clear_cache(self):
+        """Remove all cached translations"""
+        if self._cache is None:
+            return
+        count = self._cache.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+        self._cache.execute("DELETE FROM translations")
+        self._cache.commit()
+        logger.info(f"🗑️  Cleared {count} cached translations")
+
+    def commit_cache(self):
+        """Commit pending cache writes"""
+        self._cache.commit()
+        self._uncommitted = 0
+
+    def close_cache(self):
+        """Commit pending writes and close the on-disk translation cache"""
+        if self._cache is not None:
+            try:
+                self.commit_cache()
+            except sqlite3.Error as e:
+                logger.warning(f"⚠ Could not write translation cache: {e}")
+            self._cache.close()
+            self._cache = None
+
+    def cache_key(self, string_key: str) -> Optional[str]:
+        """
+        Cache key for a string, or None if it has no source text or metadata.
+
+        Hashes the full request body (prompt, model, languages, settings), so editing
+        the source text, any metadata field or the prompt template invalidates the entry.
+        Computed once per string and language list (looked up before and stored after a request).
+        """
+        source_text = self.strings.get(string_key, '')
+        if not source_text or string_key not in self.metadata:
+            return None
+        languages = self.languages_for(string_key)
+        key = self._cache_keys.get((string_key, languages))
+        if key is None:
+            prompt = self.build_multilang_prompt(string_key, source_text, self.metadata[string_key], languages)
+            encoded = json.dumps(self.build_openai_request(prompt, languages=languages), sort_keys=True,
+                                 ensure_ascii=False)
+            key = hashlib.blake2b(encoded.encode('utf-8')).hexdigest()
+            self._cache_keys[(string_key, languages)] = key
+        return key
+
+    def get_cached_translations(self, string_key: str) -> Optional[Dict[str, str]]:
+        """Return cached translations for a string, or None on a cache miss"""
+        if self._cache is None:
+            return None
+        try:
+            key = self.cache_key(string_key)
+            if key is None:
+                return None
+            row = self._cache.execute("SELECT translations FROM translations WHERE key = ?", (key,)).fetchone()
+            return _json_loads(row[0]) if row else None
+        except Exception as e:
+            logger.warning(f"⚠ [{string_key}] Could not read translation cache: {e}")
+            return None
+
+    def cache_translations(self, string_key: str, translations: Dict[str, str]):
+        """Store complete translations for a string in the cache"""
+        if self._cache is None or not translations:
+            return
+        # Only cache complete results so missing languages are retried next run
+        if not set(self.languages_for(string_key)) <= set(translations.keys()):
+            return
+        try:
+            key = self.cache_key(string_key)
+            if key is None:
+                return
+            self._cache.execute(
+                "INSERT OR REPLACE INTO translations (key, translations) VALUES (?, ?)",
+                (key, _json_dumps(translations))
+            )
+            self._uncommitted += 1
+            if self._uncommitted >= CACHE_COMMIT_INTERVAL:
+                self.commit_cache()
+        except Exception as e:
+            logger.warning(f"⚠ [{string_key}] Could not write translation cache: {e}")
+
+    def source_hash(self, string_key: str) -> str:
+        """Hash of a string's source text and prompt metadata, recorded for each saved translation"""
+        fingerprint = self.metadata_fingerprint(self.metadata.get(string_key, {}))
+        encoded = json.dumps([self.strings.get(string_key, ''), fingerprint], ensure_ascii=False)
+        return hashlib.blake2b(encoded.encode('utf-8'), digest_size=16).hexdigest()
+
+    def load_source_hashes(self) -> Dict[Tuple[str, str], str]:
+        """Recorded {(string_key, locale): source_hash} for saved translations ({} without the cache)"""
+        if self._cache is None:
+            return {}
+        try:
+            rows = self._cache.execute("SELECT string_key, locale, source_hash FROM sources")
+            return {(string_key, locale): source_hash for string_key, locale, source_hash in rows}
+        except sqlite3.Error as e:
+            logger.warning(f"⚠ Could not read recorded source hashes: {e}")
+            return {}
+
+    def record_source_hashes(self, all_translations: Dict[str, Dict[str, str]], locales: Sequence[str]):
+        """Record the source hash of every saved translation in the given locales"""
+        if self._cache is None:
+            return
+        rows = []
+        for string_key, translations in all_translations.items():
+            saved = [api_locale for api_locale in translations if api_locale in locales]
+            if saved:
+                current_hash = self.source_hash(string_key)
+                rows.extend((string_key, api_locale, current_hash) for api_locale in saved)
+        try:
+            self._cache.executemany(
+                "INSERT OR REPLACE INTO sources (string_key, locale, source_hash) VALUES (?, ?, ?)", rows
+            )
+            self.commit_cache()
+        except sqlite3.Error as e:
+            logger.warning(f"⚠ Could not record source hashes: {e}")
+
+    def languages_for(self, string_key: str) -> Tuple[str, ...]:
+        """Languages to request for a string: the missing ones when resuming, otherwise all targets"""
+        languages = self.pending_languages.get(string_key)
+        return languages if languages is not None else tuple(self.target_languages)
+
+    def language_pieces(self, languages: Optional[Sequence[str]] = None) -> Dict:
+        """Prompt and schema pieces for a language list (default: all targets), built once per list"""
+        languages = tuple(self.target_languages if languages is None else languages)
+        pieces = self._language_pieces.get(languages)
+        if pieces is None:
+            json_skeleton = "".join(
+                f'  "{lang}": "translated text in {LOCALE_NAMES.get(lang, lang)}",\n' for lang in languages
+            )
+            pieces = {
+                'languages': languages,
+                'lang_list': ", ".join(LOCALE_NAMES.get(lang, lang) for lang in languages),
+                'json_skeleton': json_skeleton,
+                'nested_json_skeleton': "".join(f"  {line}\n" for line in json_skeleton.splitlines()),
+                'schema': {
+                    "type": "object",
+                    "properties": {lang: {"type": "string"} for lang in languages},
+                    "required": list(languages),
+                    "additionalProperties": False
+                }
+            }
+            self._language_pieces[languages] = pieces
+        return pieces
+
     def load_data(self):
         """Load metadata and source strings from split YAML files or legacy JSON"""
         # Try split format first
@@ -210,12 +643,12 @@ class MultiLanguageTranslator:
         # Load source strings from XML
         if self.strings_file.exists():
             try:
-                tree = ET.parse(self.strings_file)
-                root = tree.getroot()
-                for elem in root.findall('.//string'):
+                for elem in iter_string_elements(self.strings_file):
                     name = elem.get('name')
                     if name:
                         self.strings[name] = elem.text or ''
+                        if elem.get('translatable') == 'false':
+                            self.untranslatable.add(name)
                 logger.info(f"✓ Loaded {len(self.strings)} source strings")
             except Exception as e:
                 logger.error(f"✗ Error parsing strings file: {e}")
@@ -226,59 +659,187 @@ class MultiLanguageTranslator:
     def load_existing_translations(self):
         """Load existing translations from all locale folders to support resume"""
         logger.info("📂 Checking for existing translations...")
-        res_dir = self.strings_file.parent.parent
 
         # Map to track which strings have translations in which locales
         translations_by_string = {}  # {string_key: {locale: translation}}
 
-        for api_locale in self.target_languages:
-            android_locale = LOCALE_MAPPING.get(api_locale, api_locale)
-            values_dir = res_dir / f"values-{android_locale}"
-            strings_file = values_dir / 'strings.xml'
+        # Locale files are independent, so read them in parallel
+        with ThreadPoolExecutor(max_workers=min(8, max(1, len(self.target_languages)))) as executor:
+            for api_locale, locale_strings in zip(self.target_languages,
+                                                  executor.map(self._read_locale_strings, self.target_languages)):
+                for name, text in locale_strings.items():
+                    translations_by_string.setdefault(name, {})[api_locale] = text
 
-            if strings_file.exists():
-                try:
-                    tree = ET.parse(strings_file)
-                    root = tree.getroot()
-                    for elem in root.findall('.//string'):
-                        name = elem.get('name')
-                        if name and elem.text:
-                            if name not in translations_by_string:
-                                translations_by_string[name] = {}
-                            translations_by_string[name][api_locale] = elem.text
-                except Exception as e:
-                    logger.warning(f"⚠ Could not parse {strings_file}: {e}")
-                    continue
+        # Translations saved from a different source text or metadata are stale
+        source_hashes = self.load_source_hashes()
+        stale_count = 0
 
         # Now determine which strings have COMPLETE translations (all target languages)
         complete_strings = set()
         incomplete_strings = set()
+        self.pending_languages = {}
+        target_locales = frozenset(self.target_languages)
 
         for string_key in self.metadata.keys():
-            if string_key in translations_by_string:
-                locales_present = set(translations_by_string[string_key].keys())
-                target_locales = set(self.target_languages)
+            string_translations = translations_by_string.get(string_key)
+            if string_translations:
+                current_hash = self.source_hash(string_key) if source_hashes else None
+                locales_present = set()
+                for api_locale in string_translations:
+                    recorded_hash = source_hashes.get((string_key, api_locale))
+                    # Translations saved before hashes were recorded count as current
+                    if recorded_hash is None or recorded_hash == current_hash:
+                        locales_present.add(api_locale)
+                    else:
+                        stale_count += 1
 
                 if locales_present >= target_locales:
                     # All target languages present
                     complete_strings.add(string_key)
-                else:
-                    # Some languages missing
+                elif locales_present:
+                    # Some languages missing: only those are requested
                     incomplete_strings.add(string_key)
-                    missing = target_locales - locales_present
-                    logger.debug(f"  {string_key}: missing {missing}")
+                    self.pending_languages[string_key] = tuple(
+                        lang for lang in self.target_languages if lang not in locales_present
+                    )
+                    logger.debug(f"  {string_key}: missing {set(self.pending_languages[string_key])}")
 
         self.existing_translations = translations_by_string
 
         logger.info(f"✓ Found translations:")
         logger.info(f"  - Complete: {len(complete_strings)} strings")
         logger.info(f"  - Incomplete: {len(incomplete_strings)} strings")
+        if stale_count:
+            logger.info(f"  - Stale (source changed): {stale_count} translations")
         logger.info(f"  - Missing: {len(self.metadata) - len(complete_strings) - len(incomplete_strings)} strings")
 
         return complete_strings, incomplete_strings
 
-    def build_multilang_prompt(self, string_key: str, source_text: str, metadata: Dict) -> str:
-        """Build prompt for multi-language translation"""
+    def _read_locale_strings(self, api_locale: str) -> Dict[str, str]:
+        """Read the non-empty strings of one locale's strings.xml ({} if missing or unreadable)"""
+        android_locale = LOCALE_MAPPING.get(api_locale, api_locale)
+        strings_file = self.strings_file.parent.parent / f"values-{android_locale}" / 'strings.xml'
+
+        try:
+            return {name: text for name, text in self.read_locale_file(strings_file).items() if text}
+        except Exception as e:
+            logger.warning(f"⚠ Could not parse {strings_file}: {e}")
+            return {}
+
+    def read_locale_file(self, strings_file: Path) -> Dict[str, str]:
+        """
+        Read all strings of a locale's strings.xml ({} if it doesn't exist).
+
+        The parsed file is kept in memory and only re-parsed if it changed on disk since it
+        was last read or written. Callers must not modify the returned dict.
+        """
+        try:
+            stat = strings_file.stat()
+        except FileNotFoundError:
+            return {}
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        cached = self._locale_state.get(strings_file)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        strings = read_strings_xml(strings_file)
+        self._locale_state[strings_file] = (signature, strings)
+        return strings
+
+    def remember_locale_file(self, strings_file: Path, strings: Dict[str, str]):
+        """Record the strings just written to a locale's strings.xml, so the next read skips parsing"""
+        stat = strings_file.stat()
+        self._locale_state[strings_file] = ((stat.st_mtime_ns, stat.st_size), strings)
+
+    def build_multilang_prompt(self, string_key: str, source_text: str, metadata: Dict,
+                               languages: Optional[Sequence[str]] = None) -> str:
+        """Build prompt for multi-language translation (default: all target languages)"""
+        pieces = self.language_pieces(languages)
+        parts = [
+            "Translate the following Android app string to ALL specified languages.\n\n",
+            self.build_string_context(string_key, source_text, metadata)
+        ]
+
+        parts.append(f"""
+=== TRANSLATION TASK ===
+
+Translate to these {len(pieces['languages'])} languages: {pieces['lang_list']}
+
+{TRANSLATION_REQUIREMENTS}
+Return a JSON object with translations for ALL languages:
+{{
+{pieces['json_skeleton']}}}
+
+IMPORTANT:
+- Provide ALL languages in the response
+- Preserve format specifiers in same positions
+- Stay within character limits
+- Use natural, fluent translations
+- Return ONLY the JSON object, no explanations
+""")
+
+        return "".join(parts)
+
+    def build_multi_string_prompt(self, batch: List[Tuple[str, str, Dict]],
+                                  languages: Optional[Sequence[str]] = None) -> str:
+        """Build one prompt translating several (string_key, source_text, metadata) entries"""
+        pieces = self.language_pieces(languages)
+        parts = [
+            f"Translate the following {len(batch)} Android app strings to ALL specified languages.\n",
+            "Each string has its own context and constraints - apply them only to that string.\n"
+        ]
+
+        for i, (string_key, source_text, metadata) in enumerate(batch, 1):
+            parts.append(f"\n##### STRING {i} OF {len(batch)} #####\n\n")
+            parts.append(self.build_string_context(string_key, source_text, metadata))
+
+        parts.append(f"""
+=== TRANSLATION TASK ===
+
+Translate EACH string above to these {len(pieces['languages'])} languages: {pieces['lang_list']}
+
+{TRANSLATION_REQUIREMENTS}
+Return a JSON object keyed by STRING KEY, with translations to ALL languages for EVERY string:
+{{
+""")
+        nested_json_skeleton = pieces['nested_json_skeleton']
+        parts.extend(f'  "{string_key}": {{\n{nested_json_skeleton}  }},\n' for string_key, _, _ in batch)
+
+        parts.append("""}
+
+IMPORTANT:
+- Provide ALL strings and ALL languages in the response
+- Follow each string's own length limit, tone and terminology
+- Preserve format specifiers in same positions
+- Stay within character limits
+- Use natural, fluent translations
+- Return ONLY the JSON object, no explanations
+""")
+
+        return "".join(parts)
+
+    def build_string_context(self, string_key: str, source_text: str, metadata: Dict) -> str:
+        """Build the per-string part of a prompt: source text, context, constraints and terminology"""
+        return f"STRING KEY: {string_key}\nSOURCE TEXT: {source_text}\n\n" + self.metadata_context(metadata)
+
+    @staticmethod
+    def metadata_fingerprint(metadata: Dict) -> str:
+        """Canonical encoding of the metadata fields a prompt renders (see metadata_context)"""
+        return json.dumps(
+            [metadata.get(field) for field in CONTEXT_METADATA_FIELDS], sort_keys=True, ensure_ascii=False, default=str
+        )
+
+    def metadata_context(self, metadata: Dict) -> str:
+        """Context, constraint and terminology blocks for a metadata entry, rendered once per distinct entry"""
+        fingerprint = self.metadata_fingerprint(metadata)
+        block = self._context_blocks.get(fingerprint)
+        if block is None:
+            block = self._render_metadata_context(metadata)
+            self._context_blocks[fingerprint] = block
+        return block
+
+    def _render_metadata_context(self, metadata: Dict) -> str:
         # Extract metadata
         category = metadata.get('category', 'general')
         ui = metadata.get('ui', {})
@@ -294,73 +855,62 @@ class MultiLanguageTranslator:
             ui_location += f" > {ui['section']}"
         ui_location += f" > {ui.get('element', 'text')}"
 
-        # Build language list
-        lang_names = [LOCALE_NAMES.get(lang, lang) for lang in self.target_languages]
-        lang_list = ", ".join(lang_names)
-
-        prompt = f"""Translate the following Android app string to ALL specified languages.
-
-STRING KEY: {string_key}
-SOURCE TEXT: {source_text}
-
-=== CONTEXT INFORMATION ===
+        parts = [f"""=== CONTEXT INFORMATION ===
 
 UI Location: {ui_location}
 Element Type: {ui.get('element', 'text')}
 Category: {category}
 Purpose: {purpose}
-"""
+"""]
 
         if context.get('shown_when'):
-            prompt += f"Shown When: {context['shown_when']}\n"
+            parts.append(f"Shown When: {context['shown_when']}\n")
 
         if context.get('surrounding_elements'):
             surrounding = ', '.join(context['surrounding_elements'])
-            prompt += f"Surrounding Elements: {surrounding}\n"
+            parts.append(f"Surrounding Elements: {surrounding}\n")
 
-        prompt += "\n=== TRANSLATION CONSTRAINTS ===\n\n"
+        parts.append("\n=== TRANSLATION CONSTRAINTS ===\n\n")
 
         max_length = constraints.get('max_length')
         if max_length:
-            prompt += f"Maximum Length: {max_length} characters (CRITICAL - must fit in UI)\n"
-            prompt += f"Reason: {constraints.get('reason', 'UI space limitation')}\n"
+            parts.append(f"Maximum Length: {max_length} characters (CRITICAL - must fit in UI)\n")
+            parts.append(f"Reason: {constraints.get('reason', 'UI space limitation')}\n")
         else:
-            prompt += "Maximum Length: No strict limit, but keep concise\n"
+            parts.append("Maximum Length: No strict limit, but keep concise\n")
 
         tone = guidance.get('tone', 'neutral')
         style = guidance.get('style', 'descriptive')
-        prompt += f"Tone: {tone}\n"
-        prompt += f"Style: {style}\n"
+        parts.append(f"Tone: {tone}\n")
+        parts.append(f"Style: {style}\n")
 
         terminology = guidance.get('terminology', {})
         if terminology.get('domain'):
-            prompt += f"Domain: {terminology['domain']} (use appropriate terminology)\n"
+            parts.append(f"Domain: {terminology['domain']} (use appropriate terminology)\n")
 
-        prompt += "\n=== TECHNICAL REQUIREMENTS ===\n\n"
+        parts.append("\n=== TECHNICAL REQUIREMENTS ===\n\n")
 
         if technical.get('format_specifiers'):
-            prompt += "⚠️ CRITICAL: Contains format specifiers - MUST preserve exactly!\n"
+            parts.append("⚠️ CRITICAL: Contains format specifiers - MUST preserve exactly!\n")
             specifier_info = technical.get('specifier_info', [])
             if specifier_info:
-                prompt += "Format specifiers:\n"
-                for spec in specifier_info:
-                    prompt += f"  - {spec['placeholder']} (position {spec['position']}): "
-                    if 'represents' in spec:
-                        prompt += f"{spec['represents']}\n"
-                    else:
-                        prompt += "variable\n"
-            prompt += "Preserve ALL placeholders (%s, %d, %1$s, etc.) in exact same order!\n"
+                parts.append("Format specifiers:\n")
+                parts.extend(
+                    f"  - {spec['placeholder']} (position {spec['position']}): {spec.get('represents', 'variable')}\n"
+                    for spec in specifier_info
+                )
+            parts.append("Preserve ALL placeholders (%s, %d, %1$s, etc.) in exact same order!\n")
 
         if technical.get('contains_emoji'):
             emoji = technical.get('emoji_character', '')
-            prompt += f"Contains emoji: {emoji}\n"
+            parts.append(f"Contains emoji: {emoji}\n")
             if terminology.get('preserve_emoji'):
-                prompt += "⚠️ Preserve emoji exactly in all translations.\n"
+                parts.append("⚠️ Preserve emoji exactly in all translations.\n")
 
         if technical.get('html_formatting'):
-            prompt += "⚠️ CRITICAL: Contains HTML tags - preserve all tags, translate only text!\n"
+            parts.append("⚠️ CRITICAL: Contains HTML tags - preserve all tags, translate only text!\n")
 
-        prompt += "\n=== TERMINOLOGY GUIDANCE ===\n\n"
+        parts.append("\n=== TERMINOLOGY GUIDANCE ===\n\n")
 
         if terminology.get('preferred'):
             preferred_items = []
@@ -371,7 +921,7 @@ Purpose: {purpose}
                     # Handle dict format, convert to string representation
                     preferred_items.append(str(item))
             preferred = ', '.join(preferred_items)
-            prompt += f"Preferred terms: {preferred}\n"
+            parts.append(f"Preferred terms: {preferred}\n")
 
         if terminology.get('avoid'):
             avoid_items = []
@@ -381,167 +931,524 @@ Purpose: {purpose}
                 elif isinstance(item, dict):
                     avoid_items.append(str(item))
             avoid = ', '.join(avoid_items)
-            prompt += f"Avoid: {avoid}\n"
+            parts.append(f"Avoid: {avoid}\n")
 
         if terminology.get('critical'):
-            prompt += "⚠️ CRITICAL: Translation must be unambiguous and use standard terminology.\n"
+            parts.append("⚠️ CRITICAL: Translation must be unambiguous and use standard terminology.\n")
 
         if guidance.get('cultural_notes'):
-            prompt += f"\nCultural Notes: {guidance['cultural_notes']}\n"
+            parts.append(f"\nCultural Notes: {guidance['cultural_notes']}\n")
 
-        prompt += f"""
-=== TRANSLATION TASK ===
+        return "".join(parts)
 
-Translate to these {len(self.target_languages)} languages: {lang_list}
+    def get_openai_client(self):
+        """Get the shared async OpenAI client, creating it on first use"""
+        if self._openai_client is None:
+            try:
+                import openai
+            except ImportError:
+                logger.error("✗ Error: openai package not installed")
+                logger.error("Install with: pip install openai")
+                sys.exit(1)
+
+            api_key = os.getenv('OPENAI_API_KEY')
+            if not api_key:
+                logger.error("✗ Error: OPENAI_API_KEY not set")
+                sys.exit(1)
+
+            # The SDK's pooled client, switched to HTTP/2 when h2 is installed
+            http_client = openai.DefaultAsyncHttpxClient(http2=True) if HTTP2_AVAILABLE else None
+            self._openai_client = openai.AsyncOpenAI(api_key=api_key, http_client=http_client)
+        return self._openai_client
+
+    async def close_openai_client(self):
+        """Close the shared OpenAI client, if one was created"""
+        if self._openai_client is not None:
+            client, self._openai_client = self._openai_client, None
+            await client.close()
+
+    def _run_async(self, coro):
+        """Run a coroutine with asyncio.run, closing the OpenAI client before the event loop ends"""
+        async def run():
+            try:
+                return await coro
+            finally:
+                # The client's connections belong to this event loop
+                await self.close_openai_client()
+        return asyncio.run(run())
+
+    def build_openai_request(self, prompt: str, string_keys: Optional[List[str]] = None,
+                             languages: Optional[Sequence[str]] = None) -> Dict:
+        """
+        Build the chat completion request body for a translation prompt.
+
+        With string_keys (a multi-string prompt), the response is an object keyed by
+        string key, each holding translations for the requested languages
+        (default: all target languages).
+        """
+        # JSON schema for structured output
+        schema = self.language_pieces(languages)['schema']
+        string_count = 1
+        if string_keys is not None:
+            schema = {
+                "type": "object",
+                "properties": {key: schema for key in string_keys},
+                "required": list(string_keys),
+                "additionalProperties": False
+            }
+            string_count = len(string_keys)
+
+        response_format = {
+            "type": "json_schema",
+            "json_schema": {
+                "name": "translations",
+                "strict": True,
+                "schema": schema
+            }
+        }
+
+        return {
+            "model": OPENAI_MODEL,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You are a professional translator specializing in mobile app localization. Provide accurate, natural translations that fit UI context perfectly."
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "response_format": response_format,
+            "temperature": 0.3,
+            "max_completion_tokens": MAX_COMPLETION_TOKENS_PER_STRING * string_count
+        }
+
+    def parse_translations(self, content: str, string_keys: List[str]) -> Dict[str, Dict[str, str]]:
+        """Parse a structured response into {string_key: {locale: translation}}"""
+        data = _json_loads(content)
+        if len(string_keys) == 1:
+            # Single-string requests return the translations directly
+            data = {string_keys[0]: data}
+
+        results = {}
+        for string_key in string_keys:
+            translations = data.get(string_key)
+            if not isinstance(translations, dict) or not translations:
+                logger.warning(f"⚠ [{string_key}] Missing from response")
+                continue
 
-Requirements:
-1. Translate naturally for native speakers
-2. Maintain exact same meaning and intent
-3. Respect all technical constraints (format specifiers, HTML, emoji)
-4. Stay within length limits (CRITICAL for UI fit)
-5. Match specified tone and style
-6. Use appropriate domain terminology
-7. Adapt culturally while preserving meaning
+            # Validate all languages present
+            missing = set(self.languages_for(string_key)) - set(translations.keys())
+            if missing:
+                logger.warning(f"⚠ [{string_key}] Missing translations for: {missing}")
+            results[string_key] = translations
 
-Return a JSON object with translations for ALL languages:
-{{
-"""
-        for lang in self.target_languages:
-            prompt += f'  "{lang}": "translated text in {LOCALE_NAMES.get(lang, lang)}",\n'
+        return results
 
-        prompt += """}
+    async def translate_with_openai_structured(self, request: Dict, string_keys: List[str]) -> Dict[str, Dict[str, str]]:
+        """
+        Translate using OpenAI with structured JSON output.
 
-IMPORTANT:
-- Provide ALL languages in the response
-- Preserve format specifiers in same positions
-- Stay within character limits
-- Use natural, fluent translations
-- Return ONLY the JSON object, no explanations
-"""
+        If a multi-string response can't be parsed or leaves strings out, those strings
+        are requested again one at a time.
+        """
+        client = self.get_openai_client()
+        label = ', '.join(string_keys)
 
-        return prompt
+        try:
+            content = await self._complete_with_retry(client, request, label)
+        except Exception as e:
+            logger.error(f"✗ [{label}] Error calling OpenAI: {e}")
+            logger.debug(traceback.format_exc())
+            return {}
+        logger.debug(f"[{label}] Received {len(content)} characters")
 
-    def translate_with_openai_structured(self, prompt: str, string_key: str) -> Dict[str, str]:
-        """Translate using OpenAI with structured JSON output"""
         try:
-            import openai
-        except ImportError:
-            logger.error("✗ Error: openai package not installed")
-            logger.error("Install with: pip install openai")
-            sys.exit(1)
+            results = self.parse_translations(content, string_keys)
+        except json.JSONDecodeError as e:
+            logger.error(f"✗ [{label}] JSON decode error: {e}")
+            logger.debug(f"Response content: {content or 'N/A'}")
+            logger.debug(traceback.format_exc())
+            results = {}
+        except Exception as e:
+            logger.error(f"✗ [{label}] Could not parse response: {e}")
+            logger.debug(traceback.format_exc())
+            results = {}
+
+        retry_keys = [key for key in string_keys if key not in results] if len(string_keys) > 1 else []
+        if retry_keys:
+            logger.warning(f"⚠ [{label}] Requesting {len(retry_keys)} strings again one at a time")
+            for key in retry_keys:
+                _, single_request = self.prepare_request([key])
+                if single_request is not None:
+                    results.update(await self.translate_with_openai_structured(single_request, [key]))
+        return results
+
+    async def _complete_with_retry(self, client, request: Dict, label: str) -> str:
+        """Stream a chat completion, retrying transient failures with exponential backoff"""
+        import openai
+
+        retryable = (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError)
+        limiter = self._rate_limiter
+        # Rough prompt size (~4 characters per token) for tokens-per-minute pacing
+        estimated_tokens = sum(len(message['content']) for message in request['messages']) // 4
+        delay = OPENAI_RETRY_INITIAL_SECONDS
+        for attempt in range(1, OPENAI_MAX_ATTEMPTS + 1):
+            try:
+                if limiter is not None:
+                    await limiter.wait_for_capacity(estimated_tokens)
+                # Stream the response so waiting on tokens yields to other requests
+                parts = []
+                stream = await client.chat.completions.create(**request, stream=True)
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        parts.append(chunk.choices[0].delta.content)
+                return ''.join(parts)
+            except retryable as e:
+                if limiter is not None and isinstance(e, openai.RateLimitError):
+                    limiter.throttled()
+                if attempt == OPENAI_MAX_ATTEMPTS:
+                    raise
+
+                # Honor the server's Retry-After hint when it sends one
+                wait = delay
+                response = getattr(e, 'response', None)
+                retry_after = response.headers.get('retry-after') if response is not None else None
+                if retry_after:
+                    try:
+                        wait = min(float(retry_after), OPENAI_RETRY_MAX_SECONDS)
+                    except ValueError:
+                        pass
 
-        api_key = os.getenv('OPENAI_API_KEY')
-        if not api_key:
-            logger.error("✗ Error: OPENAI_API_KEY not set")
-            sys.exit(1)
+                logger.warning(f"⚠ [{label}] {type(e).__name__} (attempt {attempt}/{OPENAI_MAX_ATTEMPTS}), "
+                               f"retrying in {wait:g}s")
+                await asyncio.sleep(wait)
+                delay = min(delay * 2, OPENAI_RETRY_MAX_SECONDS)
 
-        try:
-            client = openai.OpenAI(api_key=api_key)
-
-            # Build JSON schema for structured output
-            properties = {}
-            required = []
-            for lang in self.target_languages:
-                properties[lang] = {"type": "string"}
-                required.append(lang)
-
-            response_format = {
-                "type": "json_schema",
-                "json_schema": {
-                    "name": "translations",
-                    "strict": True,
-                    "schema": {
-                        "type": "object",
-                        "properties": properties,
-                        "required": required,
-                        "additionalProperties": False
-                    }
-                }
-            }
+    def translate_string(self, string_key: str, dry_run: bool = False) -> Dict[str, str]:
+        """Translate a single string to all target languages"""
+        return self._run_async(self.translate_string_async(string_key, dry_run))
 
-            response = client.chat.completions.create(
-                model=OPENAI_MODEL,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a professional translator specializing in mobile app localization. Provide accurate, natural translations that fit UI context perfectly."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                response_format=response_format,
-                temperature=0.3,
-                max_completion_tokens=2000
-            )
+    def is_translatable(self, string_key: str) -> bool:
+        """False for strings marked translatable="false" in strings.xml or translatable: false in metadata"""
+        if string_key in self.untranslatable:
+            return False
+        return self.metadata.get(string_key, {}).get('translatable', True) is not False
 
-            translations = json.loads(response.choices[0].message.content)
+    def can_translate(self, string_key: str) -> bool:
+        """Check a string is translatable and has metadata and source text, warning if not"""
+        if not self.is_translatable(string_key):
+            logger.warning(f"⚠ [{string_key}] Marked as not translatable, skipping")
+            return False
 
-            # Validate all languages present
-            missing = set(self.target_languages) - set(translations.keys())
-            if missing:
-                logger.warning(f"⚠ [{string_key}] Missing translations for: {missing}")
+        if string_key not in self.metadata:
+            logger.warning(f"⚠ [{string_key}] No metadata found, skipping")
+            return False
 
-            return translations
+        if not self.strings.get(string_key, ''):
+            logger.warning(f"⚠ [{string_key}] No source text found, skipping")
+            return False
 
-        except json.JSONDecodeError as e:
-            logger.error(f"✗ [{string_key}] JSON decode error: {e}")
-            logger.debug(f"Response content: {response.choices[0].message.content if 'response' in locals() else 'N/A'}")
-            logger.debug(traceback.format_exc())
-            return {}
+        return True
+
+    def prepare_prompt(self, string_key: str) -> Optional[str]:
+        """Build the translation prompt for a string, or None if it can't be translated"""
+        if not self.can_translate(string_key):
+            return None
+
+        try:
+            return self.build_multilang_prompt(string_key, self.strings[string_key], self.metadata[string_key],
+                                               self.languages_for(string_key))
         except Exception as e:
-            logger.error(f"✗ [{string_key}] Error calling OpenAI: {e}")
+            logger.error(f"✗ [{string_key}] Error building prompt: {e}")
             logger.debug(traceback.format_exc())
-            return {}
+            return None
 
-    def translate_string(self, string_key: str, dry_run: bool = False) -> Dict[str, str]:
-        """Translate a single string to all target languages"""
-        try:
-            if string_key not in self.metadata:
-                logger.warning(f"⚠ [{string_key}] No metadata found, skipping")
-                return {}
+    def prepare_request(self, string_keys: List[str]) -> Tuple[List[str], Optional[Dict]]:
+        """
+        Build one chat completion request for a group of strings.
 
-            source_text = self.strings.get(string_key, '')
-            if not source_text:
-                logger.warning(f"⚠ [{string_key}] No source text found, skipping")
-                return {}
+        All strings in the group must need the same languages (see languages_for).
 
-            metadata = self.metadata[string_key]
+        Returns:
+            The keys the request covers (strings that can't be translated are dropped)
+            and the request body, or None if none of the strings can be translated
+        """
+        keys = [key for key in string_keys if self.can_translate(key)]
 
-            try:
-                prompt = self.build_multilang_prompt(string_key, source_text, metadata)
-            except Exception as e:
-                logger.error(f"✗ [{string_key}] Error building prompt: {e}")
-                logger.debug(traceback.format_exc())
+        if not keys:
+            return [], None
+        languages = self.languages_for(keys[0])
+
+        if len(keys) == 1:
+            prompt = self.prepare_prompt(keys[0])
+            return (keys, self.build_openai_request(prompt, languages=languages)) if prompt is not None else ([], None)
+
+        try:
+            batch = [(key, self.strings[key], self.metadata[key]) for key in keys]
+            prompt = self.build_multi_string_prompt(batch, languages)
+            return keys, self.build_openai_request(prompt, keys, languages)
+        except Exception as e:
+            logger.error(f"✗ [{', '.join(keys)}] Error building prompt: {e}")
+            logger.debug(traceback.format_exc())
+            return [], None
+
+    def split_cached(self, string_keys: List[str]) -> Tuple[Dict[str, Dict[str, str]], List[str]]:
+        """Split strings into cached translations and keys that still need translating"""
+        cached_translations = {}
+        pending = []
+        for key in string_keys:
+            cached = self.get_cached_translations(key)
+            if cached is not None:
+                cached_translations[key] = cached
+            else:
+                pending.append(key)
+
+        if cached_translations:
+            logger.info(f"✓ {len(cached_translations)} strings served from translation cache")
+        return cached_translations, pending
+
+    def deduplicate(self, string_keys: List[str]) -> Tuple[List[str], Dict[str, str]]:
+        """
+        Set aside strings whose request would only differ from an earlier string's by its key.
+
+        Strings count as duplicates when their source text, rendered metadata and pending
+        languages all match, so the same text in a different UI context is still translated
+        on its own.
+
+        Returns:
+            The keys to translate, and {duplicate key: key whose translations it reuses}
+        """
+        unique = []
+        duplicates = {}
+        first_by_request = {}
+        for key in string_keys:
+            source_text = self.strings.get(key)
+            if not source_text or key not in self.metadata:
+                # Not translatable; prepare_request reports it
+                unique.append(key)
+                continue
+            request = (source_text, self.languages_for(key), self.metadata_fingerprint(self.metadata[key]))
+            first = first_by_request.setdefault(request, key)
+            if first == key:
+                unique.append(key)
+            else:
+                duplicates[key] = first
+
+        if duplicates:
+            logger.info(f"♻️  {len(duplicates)} strings reuse the translations of an identical request")
+        return unique, duplicates
+
+    def share_translations(self, results: Dict, duplicates: Dict[str, str]):
+        """Give each duplicate (see deduplicate) the result of the string it was set aside for"""
+        for key, original in duplicates.items():
+            result = results.get(original)
+            if result and not isinstance(result, Exception):
+                self.cache_translations(key, result)
+            results[key] = result
+
+    def group_for_requests(self, string_keys: List[str]) -> List[List[str]]:
+        """
+        Split strings into request groups of up to STRINGS_PER_REQUEST that need the same languages.
+
+        Groups are smaller if their output budget would exceed MAX_COMPLETION_TOKENS_PER_REQUEST.
+        """
+        group_size = max(1, min(STRINGS_PER_REQUEST,
+                                MAX_COMPLETION_TOKENS_PER_REQUEST // MAX_COMPLETION_TOKENS_PER_STRING))
+
+        by_languages = {}  # {languages: [string_key, ...]}, in first-seen order
+        for key in string_keys:
+            by_languages.setdefault(self.languages_for(key), []).append(key)
+
+        return [
+            keys[i:i + group_size]
+            for keys in by_languages.values()
+            for i in range(0, len(keys), group_size)
+        ]
+
+    async def translate_string_async(self, string_key: str, dry_run: bool = False) -> Dict[str, str]:
+        """Translate a single string to all target languages (awaitable)"""
+        if not dry_run:
+            cached = self.get_cached_translations(string_key)
+            if cached is not None:
+                logger.info(f"[{string_key}] ✓ Cached ({len(cached)} languages)")
+                return cached
+
+        results = await self.translate_group_async([string_key], dry_run)
+        return results.get(string_key, {})
+
+    async def translate_group_async(self, string_keys: List[str], dry_run: bool = False) -> Dict[str, Dict[str, str]]:
+        """Translate a group of strings to all target languages with one request"""
+        try:
+            keys, request = self.prepare_request(string_keys)
+            if request is None:
                 return {}
+            label = ', '.join(keys)
 
             if dry_run:
                 logger.info(f"\n{'='*80}")
-                logger.info(f"DRY RUN - PROMPT FOR: {string_key}")
+                logger.info(f"DRY RUN - PROMPT FOR: {label}")
                 logger.info(f"{'='*80}")
-                logger.info(prompt)
+                logger.info(request['messages'][-1]['content'])
                 logger.info(f"{'='*80}\n")
                 # Return source text as "translations" for dry run
-                return {lang: source_text for lang in self.target_languages}
+                return {key: {lang: self.strings[key] for lang in self.languages_for(key)} for key in keys}
 
-            logger.info(f"[{string_key}] Translating to {len(self.target_languages)} languages...")
+            logger.info(f"[{label}] Translating to {len(self.languages_for(keys[0]))} languages...")
 
-            translations = self.translate_with_openai_structured(prompt, string_key)
+            results = await self.translate_with_openai_structured(request, keys)
 
-            if translations:
-                logger.info(f"[{string_key}] ✓ Completed ({len(translations)} languages)")
-                return translations
-            else:
-                logger.error(f"[{string_key}] ✗ Translation failed")
-                return {}
+            for key in keys:
+                translations = results.get(key)
+                if translations:
+                    self.cache_translations(key, translations)
+                    logger.info(f"[{key}] ✓ Completed ({len(translations)} languages)")
+                else:
+                    logger.error(f"[{key}] ✗ Translation failed")
+            return results
+
+        except Exception as e:
+            logger.error(f"✗ [{', '.join(string_keys)}] Unexpected error: {e}")
+            logger.debug(traceback.format_exc())
+            return {}
 
+    async def _translate_limited(self, limiter: RateLimiter, position: str, string_keys: List[str],
+                                 dry_run: bool) -> Dict[str, Dict[str, str]]:
+        """Translate one group of strings once a concurrency slot is free"""
+        await limiter.acquire()
+        results = {}
+        try:
+            logger.info(f"[{position}] Processing {', '.join(string_keys)}...")
+            results = await self.translate_group_async(string_keys, dry_run)
+            return results
+        finally:
+            await limiter.release(succeeded=bool(results))
+
+    async def _run_batch(self, keys: List[str], dry_run: bool) -> List:
+        """
+        Translate strings concurrently, STRINGS_PER_REQUEST per request and at most
+        self.concurrency requests at a time, paced by a RateLimiter.
+        Returns one result per key.
+        """
+        results = {}
+        pending = keys
+        duplicates = {}
+        if not dry_run:
+            # Cache hits and repeats of another string's request don't need a request
+            results, pending = self.split_cached(keys)
+            pending, duplicates = self.deduplicate(pending)
+            if pending:
+                # Create the client up front so a setup error stops the run once
+                self.get_openai_client()
+
+        groups = self.group_for_requests(pending)
+        requests_per_minute, tokens_per_minute = RATE_LIMIT_PROFILES.get(self.provider, RATE_LIMIT_PROFILES['openai'])
+        limiter = RateLimiter(self.concurrency,
+                              int(os.getenv('TRANSLATION_RPM', requests_per_minute)),
+                              int(os.getenv('TRANSLATION_TPM', tokens_per_minute)))
+        tasks = [
+            self._translate_limited(limiter, f"{i}/{len(groups)}", group, dry_run)
+            for i, group in enumerate(groups, 1)
+        ]
+        self._rate_limiter = limiter
+        try:
+            group_results = await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            self._rate_limiter = None
+
+        for group, group_result in zip(groups, group_results):
+            for key in group:
+                # A failed request fails every string in its group
+                results[key] = group_result if isinstance(group_result, Exception) else group_result.get(key)
+        self.share_translations(results, duplicates)
+        return [results.get(key) for key in keys]
+
+    async def _run_openai_batch(self, keys: List[str]) -> Dict[str, Dict[str, str]]:
+        """Submit all prompts as one OpenAI Batch API job and wait for its results"""
+        # Cached strings and repeats of another string's request are not submitted
+        results, pending = self.split_cached(keys)
+        pending, duplicates = self.deduplicate(pending)
+
+        # One JSONL line per group of STRINGS_PER_REQUEST strings
+        lines = []
+        keys_by_request = {}  # {custom_id: [string_key, ...]}
+        for group in self.group_for_requests(pending):
+            group_keys, body = self.prepare_request(group)
+            if body is not None:
+                custom_id = f"request-{len(lines) + 1}"
+                keys_by_request[custom_id] = group_keys
+                request = {
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": body
+                }
+                lines.append(_json_dumps(request))
+        if not lines:
+            return results
+
+        client = self.get_openai_client()
+        payload = ('\n'.join(lines) + '\n').encode('utf-8')
+        input_file = await client.files.create(file=('translations.jsonl', payload), purpose='batch')
+        batch = await client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window=BATCH_COMPLETION_WINDOW
+        )
+        string_count = sum(len(group_keys) for group_keys in keys_by_request.values())
+        logger.info(f"📦 Submitted batch {batch.id} with {string_count} strings in {len(lines)} requests")
+
+        # Poll with exponential backoff until the batch finishes
+        delay = BATCH_POLL_INITIAL_SECONDS
+        while batch.status not in BATCH_FINAL_STATUSES:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, BATCH_POLL_MAX_SECONDS)
+            batch = await client.batches.retrieve(batch.id)
+            logger.info(f"⏳ Batch {batch.id}: {batch.status}")
+
+        if batch.status != 'completed' or not batch.output_file_id:
+            logger.error(f"✗ Batch {batch.id} finished with status '{batch.status}'")
+            return results
+
+        output = await client.files.content(batch.output_file_id)
+        # Parse the raw bytes; orjson decodes UTF-8 itself
+        for line in output.content.splitlines():
+            if not line.strip():
+                continue
+            item = _json_loads(line)
+            group_keys = keys_by_request.get(item.get('custom_id'))
+            if not group_keys:
+                continue
+            label = ', '.join(group_keys)
+            response = item.get('response') or {}
+            if response.get('status_code') != 200:
+                logger.error(f"✗ [{label}] Batch request failed: {item.get('error') or response.get('status_code')}")
+                continue
+            try:
+                translations = self.parse_translations(response['body']['choices'][0]['message']['content'], group_keys)
+            except (KeyError, IndexError, TypeError, AttributeError, json.JSONDecodeError) as e:
+                logger.error(f"✗ [{label}] Could not parse batch response: {e}")
+                continue
+
+            for key, string_translations in translations.items():
+                self.cache_translations(key, string_translations)
+                results[key] = string_translations
+
+        self.share_translations(results, duplicates)
+        return results
+
+    def translate_all_batch(self, keys: List[str]) -> Dict[str, Dict[str, str]]:
+        """Translate strings through the OpenAI Batch API (half the cost, results within 24h)"""
+        try:
+            return self._run_async(self._run_openai_batch(keys))
         except Exception as e:
-            logger.error(f"✗ [{string_key}] Unexpected error: {e}")
+            logger.error(f"✗ Error running OpenAI batch: {e}")
             logger.debug(traceback.format_exc())
             return {}
 
-    def translate_all(self, specific_key: Optional[str] = None, dry_run: bool = False, force: bool = False) -> Dict[str, Dict[str, str]]:
+    def translate_all(self, specific_key: Optional[str] = None, dry_run: bool = False, force: bool = False,
+                      use_batch: bool = False) -> Dict[str, Dict[str, str]]:
         """Translate all documented strings or a specific one"""
         all_translations = {}  # {string_key: {locale: translation}}
         failed_keys = []  # Track failed translations
@@ -561,7 +1468,10 @@ IMPORTANT:
                     logger.debug(traceback.format_exc())
                     failed_keys.append(specific_key)
             else:
-                documented_keys = list(self.metadata.keys())
+                # Strings marked not translatable never need a request
+                documented_keys = [key for key in self.metadata if self.is_translatable(key)]
+                if len(documented_keys) < len(self.metadata):
+                    logger.info(f"⏭️  Skipping {len(self.metadata) - len(documented_keys)} strings marked as not translatable")
 
                 # Load existing translations to support resume (unless force mode)
                 complete_strings = set()
@@ -578,27 +1488,32 @@ IMPORTANT:
                     if complete_strings:
                         logger.info(f"\n🌐 RESUME MODE: Skipping {len(complete_strings)} already-translated strings")
                     logger.info(f"🌐 Translating {len(keys_to_translate)} strings to {len(self.target_languages)} languages")
+                    if self.pending_languages:
+                        logger.info(f"   ({len(self.pending_languages)} of them only to their missing languages)")
 
                 logger.info(f"{'='*80}")
 
-                for i, key in enumerate(keys_to_translate, 1):
-                    try:
-                        logger.info(f"[{i}/{len(keys_to_translate)}] Processing {key}...")
-                        translations = self.translate_string(key, dry_run)
-                        if translations:
-                            all_translations[key] = translations
-                        else:
-                            failed_keys.append(key)
-                    except Exception as e:
-                        logger.error(f"✗ [{key}] Failed to translate: {e}")
-                        logger.debug(traceback.format_exc())
+                if use_batch and not dry_run:
+                    batch_translations = self.translate_all_batch(keys_to_translate)
+                    results = [batch_translations.get(key) for key in keys_to_translate]
+                else:
+                    # Translate concurrently; a failed string doesn't stop the others
+                    results = self._run_async(self._run_batch(keys_to_translate, dry_run))
+
+                for key, result in zip(keys_to_translate, results):
+                    if isinstance(result, Exception):
+                        logger.error(f"✗ [{key}] Failed to translate: {result}")
+                        logger.debug(''.join(traceback.format_exception(type(result), result, result.__traceback__)))
+                        failed_keys.append(key)
+                    elif result:
+                        all_translations[key] = result
+                    else:
                         failed_keys.append(key)
-                        # Continue with next string instead of failing
 
                 skipped_keys = list(complete_strings)
 
             total_translations = sum(len(t) for t in all_translations.values())
-            logger.info(f"\n✓ Completed: {len(all_translations)} strings × {len(self.target_languages)} languages = {total_translations} translations")
+            logger.info(f"\n✓ Completed: {len(all_translations)} strings, {total_translations} translations")
 
             if skipped_keys:
                 logger.info(f"⏭️  Skipped: {len(skipped_keys)} already-translated strings")
@@ -628,128 +1543,120 @@ IMPORTANT:
         failed_locales = []
 
         try:
-            # Group translations by locale
-            by_locale = {}  # {locale: {string_key: translation}}
+            # Group translations by API locale, then map each locale to its Android folder once
+            by_api_locale = {}  # {api_locale: {string_key: translation}}
             for string_key, translations in all_translations.items():
                 for api_locale, translation in translations.items():
-                    android_locale = LOCALE_MAPPING.get(api_locale, api_locale)
-                    if android_locale not in by_locale:
-                        by_locale[android_locale] = {}
-                    by_locale[android_locale][string_key] = translation
+                    by_api_locale.setdefault(api_locale, {})[string_key] = translation
 
-            # Save each locale
-            for android_locale, translations in by_locale.items():
-                try:
-                    values_dir = res_dir / f"values-{android_locale}"
-                    values_dir.mkdir(parents=True, exist_ok=True)
-                    output_file = values_dir / 'strings.xml'
-
-                    # Load existing translations if file exists
-                    existing = {}
-                    if output_file.exists():
-                        try:
-                            tree = ET.parse(output_file)
-                            root = tree.getroot()
-                            for elem in root.findall('.//string'):
-                                name = elem.get('name')
-                                if name:
-                                    existing[name] = elem.text or ''
-                        except Exception as e:
-                            logger.warning(f"⚠ [{android_locale}] Could not load existing translations: {e}")
-                            # Continue with empty existing dict
-
-                    # Escape new translations from API before merging
-                    try:
-                        escaped_translations = {
-                            key: escape_android_string(value)
-                            for key, value in translations.items()
-                        }
-                    except Exception as e:
-                        logger.error(f"✗ [{android_locale}] Error escaping translations: {e}")
-                        logger.debug(traceback.format_exc())
+            by_locale = {}  # {locale: {string_key: translation}}
+            for api_locale, locale_translations in by_api_locale.items():
+                by_locale.setdefault(LOCALE_MAPPING.get(api_locale, api_locale), {}).update(locale_translations)
+
+            # Save each locale (independent files, written in parallel)
+            with ThreadPoolExecutor(max_workers=min(8, max(1, len(by_locale)))) as executor:
+                locales = list(by_locale)
+                results = executor.map(lambda locale: self._save_locale(locale, by_locale[locale], res_dir), locales)
+                for android_locale, saved in zip(locales, results):
+                    if saved:
+                        saved_locales.add(android_locale)
+                    else:
                         failed_locales.append(android_locale)
-                        continue
 
-                    # Merge with new translations
-                    existing.update(escaped_translations)
-
-                    # Build XML
-                    try:
-                        root = ET.Element('resources')
-                        root.set('xmlns:tools', 'http://schemas.android.com/tools')
-                        root.set('tools:ignore', 'MissingTranslation')
-
-                        for key in sorted(existing.keys()):
-                            string_elem = ET.SubElement(root, 'string')
-                            string_elem.set('name', key)
-                            # Text is already escaped (either from existing file or from escaped_translations)
-                            string_elem.text = existing[key]
-
-                            # Preserve formatted attribute if needed
-                            if key in self.metadata:
-                                technical = self.metadata[key].get('technical', {})
-                                if technical.get('format_specifiers'):
-                                    string_elem.set('formatted', 'false')
-
-                            # Auto-detect placeholders and add formatted="false"
-                            # This prevents Android lint warnings for strings with multiple % symbols
-
-                            # Pattern 1: Custom placeholders like %variableName%
-                            has_custom_placeholders = existing[key] and re.search(r'%\w+%', existing[key])
-
-                            # Pattern 2: Multiple Android format specifiers (%s, %d, %f, etc.)
-                            # Count occurrences of % followed by common format specifiers
-                            android_specs = re.findall(r'%[sdifgeoxX]', existing[key]) if existing[key] else []
-                            has_multiple_android_specs = len(android_specs) >= 2
-
-                            if (has_custom_placeholders or has_multiple_android_specs):
-                                # Only add if not already set by format_specifiers above
-                                if 'formatted' not in string_elem.attrib:
-                                    string_elem.set('formatted', 'false')
-                    except Exception as e:
-                        logger.error(f"✗ [{android_locale}] Error building XML: {e}")
-                        logger.debug(traceback.format_exc())
-                        failed_locales.append(android_locale)
-                        continue
+            logger.info(f"\n📁 Translations saved to {len(saved_locales)} locale folders")
 
-                    # Pretty print and write file
-                    try:
-                        from xml.dom import minidom
-                        xml_string = ET.tostring(root, encoding='UTF-8')
-                        dom = minidom.parseString(xml_string)
-                        pretty_xml = dom.toprettyxml(indent="  ", encoding='UTF-8')
+            # Remember what each saved translation was made from, so later edits mark it stale
+            self.record_source_hashes(all_translations, [
+                api_locale for api_locale in self.target_languages
+                if LOCALE_MAPPING.get(api_locale, api_locale) in saved_locales
+            ])
 
-                        lines = pretty_xml.decode('utf-8').split('\n')
-                        lines = [line for line in lines if line.strip()]
+            if failed_locales:
+                logger.warning(f"\n⚠ Failed to save {len(failed_locales)} locales: {', '.join(failed_locales)}")
 
-                        # Write file
-                        with open(output_file, 'w', encoding='utf-8') as f:
-                            f.write('<?xml version="1.0" encoding="utf-8"?>\n')
-                            f.write('\n'.join(lines[1:]))
-                            f.write('\n')
+        except Exception as e:
+            logger.error(f"✗ Unexpected error in save_translations: {e}")
+            logger.debug(traceback.format_exc())
 
-                        saved_locales.add(android_locale)
-                        logger.info(f"✓ Saved {len(translations)} strings to values-{android_locale}/strings.xml")
-                    except Exception as e:
-                        logger.error(f"✗ [{android_locale}] Error writing file: {e}")
-                        logger.debug(traceback.format_exc())
-                        failed_locales.append(android_locale)
-                        continue
+    def _save_locale(self, android_locale: str, translations: Dict[str, str], res_dir: Path) -> bool:
+        """Merge translations into one locale's strings.xml; returns whether it was saved"""
+        try:
+            values_dir = res_dir / f"values-{android_locale}"
+            values_dir.mkdir(parents=True, exist_ok=True)
+            output_file = values_dir / 'strings.xml'
 
+            # Load existing translations if file exists (copied: the parsed file stays cached)
+            existing = {}
+            if output_file.exists():
+                try:
+                    existing = dict(self.read_locale_file(output_file))
                 except Exception as e:
-                    logger.error(f"✗ [{android_locale}] Unexpected error saving locale: {e}")
-                    logger.debug(traceback.format_exc())
-                    failed_locales.append(android_locale)
-                    # Continue with next locale
+                    logger.warning(f"⚠ [{android_locale}] Could not load existing translations: {e}")
+                    # Continue with empty existing dict
 
-            logger.info(f"\n📁 Translations saved to {len(saved_locales)} locale folders")
+            # Escape new translations from API before merging
+            try:
+                escaped_translations = {
+                    key: escape_android_string(value)
+                    for key, value in translations.items()
+                }
+            except Exception as e:
+                logger.error(f"✗ [{android_locale}] Error escaping translations: {e}")
+                logger.debug(traceback.format_exc())
+                return False
 
-            if failed_locales:
-                logger.warning(f"\n⚠ Failed to save {len(failed_locales)} locales: {', '.join(failed_locales)}")
+            # Merge with new translations
+            existing.update(escaped_translations)
+
+            # Collect (name, text, formatted="false") entries in key order
+            try:
+                entries = []
+
+                for key in sorted(existing.keys()):
+                    # Text is already escaped (either from existing file or from escaped_translations)
+                    text = existing[key]
+
+                    # Preserve formatted attribute if needed
+                    unformatted = False
+                    if key in self.metadata:
+                        technical = self.metadata[key].get('technical', {})
+                        unformatted = bool(technical.get('format_specifiers'))
+
+                    # Auto-detect placeholders and add formatted="false"
+                    # This prevents Android lint warnings for strings with multiple % symbols
+                    # (most strings have no % at all and skip the regexes)
+                    if not unformatted and text and '%' in text:
+                        # Pattern 1: Custom placeholders like %variableName%
+                        has_custom_placeholders = CUSTOM_PLACEHOLDER_PATTERN.search(text)
+
+                        # Pattern 2: Multiple Android format specifiers (%s, %d, %f, etc.)
+                        # Count occurrences of % followed by common format specifiers
+                        has_multiple_android_specs = len(ANDROID_SPECIFIER_PATTERN.findall(text)) >= 2
+
+                        unformatted = bool(has_custom_placeholders or has_multiple_android_specs)
+
+                    entries.append((key, text, unformatted))
+            except Exception as e:
+                logger.error(f"✗ [{android_locale}] Error building XML: {e}")
+                logger.debug(traceback.format_exc())
+                return False
+
+            # Stream the indented file out
+            try:
+                write_strings_xml(output_file, entries)
+                self.remember_locale_file(output_file, existing)
+
+                logger.info(f"✓ Saved {len(translations)} strings to values-{android_locale}/strings.xml")
+                return True
+            except Exception as e:
+                logger.error(f"✗ [{android_locale}] Error writing file: {e}")
+                logger.debug(traceback.format_exc())
+                return False
 
         except Exception as e:
-            logger.error(f"✗ Unexpected error in save_translations: {e}")
+            logger.error(f"✗ [{android_locale}] Unexpected error saving locale: {e}")
             logger.debug(traceback.format_exc())
+            return False
 
 
 def print_usage():
@@ -771,6 +1678,12 @@ Options:
     --output              Save translations to values-*/strings.xml files
     --dry-run             Show prompts without calling AI API
     --force               Force re-translate all strings (ignore existing)
+    --batch               Submit all strings as one OpenAI Batch API job
+                          (50% cheaper, results may take up to 24h)
+    --no-cache            Don't read or write the translation cache
+    --clear-cache         Empty the translation cache before translating
+    --concurrency N       Max parallel API requests (default: 10, or
+                          TRANSLATION_CONCURRENCY)
     --provider PROVIDER   Use 'openai' or 'anthropic' (default: openai)
     --help                Show this help message
 
@@ -781,6 +1694,11 @@ Environment Variables:
     OPENAI_API_KEY          Your OpenAI API key (required)
     ANTHROPIC_API_KEY       Your Anthropic API key (alternative)
     AI_TRANSLATION_PROVIDER Provider: 'openai' or 'anthropic'
+    TRANSLATION_CONCURRENCY Max parallel API requests (default: 10)
+    TRANSLATION_RPM         Max API requests per minute (0 = no limit)
+    TRANSLATION_TPM         Max prompt tokens per minute (0 = no limit)
+    TRANSLATION_STRINGS_PER_REQUEST
+                            Strings translated per API request (default: 5)
 
 Supported Languages (21):
     en, zh-CN, zh-TW, hi, es, ar, pt-BR, id, bn, ru, ja, de, fr, ko, tr, vi, it, th, pl, uk
@@ -801,63 +1719,66 @@ Examples:
     # Translate to specific languages only
     python translate_with_context.py --languages ru,fr,es --output
 
+    # Translate the whole catalog at batch pricing
+    python translate_with_context.py --all-languages --output --batch
+
 Resume Support:
     The script automatically detects existing translations and only translates
-    missing strings. This allows you to:
+    missing strings, requesting just the languages each string is missing.
+    Translations saved while the cache is enabled are also re-translated once
+    their source text or metadata changes. This allows you to:
     - Resume after interruption (Ctrl+C)
     - Add new strings without re-translating everything
     - Re-run safely without wasting API calls
 
     Use --force to ignore existing translations and re-translate everything.
+
+Translation Cache:
+    Finished translations are cached in {TRANSLATION_CACHE_FILE}, keyed by a
+    hash of the API request (source text, metadata, languages, model). Strings
+    whose request is unchanged are served from the cache, even with --force. Use --clear-cache to start fresh or --no-cache to bypass it.
 """)
 
 
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser (see print_usage for the documented options)"""
+    parser = argparse.ArgumentParser(description='AI Translation with Context for DiveSMS', add_help=False)
+    parser.add_argument('--profile', default=DEFAULT_PROFILE)
+    # --all-languages and --languages share a destination; the last one given wins
+    parser.add_argument('--all-languages', dest='languages', action='store_const', const=ALL_LANGUAGES)
+    parser.add_argument('--languages', dest='languages', type=lambda codes: codes.split(','))
+    parser.add_argument('--string', dest='specific_key')
+    parser.add_argument('--output', action='store_true')
+    parser.add_argument('--dry-run', action='store_true')
+    parser.add_argument('--force', action='store_true')
+    parser.add_argument('--batch', action='store_true')
+    parser.add_argument('--no-cache', dest='use_cache', action='store_false')
+    parser.add_argument('--clear-cache', action='store_true')
+    parser.add_argument('--concurrency', type=int, default=TRANSLATION_CONCURRENCY)
+    parser.add_argument('--provider', default=AI_PROVIDER)
+    parser.add_argument('-h', '--help', action='store_true')
+    return parser
+
+
 def main():
     try:
         logger.info(f"📝 Logging to: {log_file}")
 
-        if '--help' in sys.argv:
+        args = build_parser().parse_args()
+
+        if args.help:
             print_usage()
             return
 
-        # Parse arguments
-        target_languages = []
-        specific_key = None
-        save_output = False
-        dry_run = False
-        force = False
-        profile = DEFAULT_PROFILE
-
-        i = 1
-        while i < len(sys.argv):
-            arg = sys.argv[i]
-            if arg == '--profile' and i + 1 < len(sys.argv):
-                profile = sys.argv[i + 1]
-                i += 2
-            elif arg == '--all-languages':
-                target_languages = ALL_LANGUAGES
-                i += 1
-            elif arg == '--languages' and i + 1 < len(sys.argv):
-                target_languages = sys.argv[i + 1].split(',')
-                i += 2
-            elif arg == '--string' and i + 1 < len(sys.argv):
-                specific_key = sys.argv[i + 1]
-                i += 2
-            elif arg == '--output':
-                save_output = True
-                i += 1
-            elif arg == '--dry-run':
-                dry_run = True
-                i += 1
-            elif arg == '--force':
-                force = True
-                i += 1
-            elif arg == '--provider' and i + 1 < len(sys.argv):
-                global AI_PROVIDER
-                AI_PROVIDER = sys.argv[i + 1]
-                i += 2
-            else:
-                i += 1
+        target_languages = args.languages or []
+        specific_key = args.specific_key
+        save_output = args.output
+        dry_run = args.dry_run
+        force = args.force
+        use_batch = args.batch
+        use_cache = args.use_cache
+        clear_cache = args.clear_cache
+        profile = args.profile
 
         # Validate profile
         if profile not in PROFILES:
@@ -890,20 +1811,30 @@ def main():
             logger.info(f"   Mode: DRY RUN (no API calls)")
         if force:
             logger.info(f"   Mode: FORCE (re-translate all)")
+        if use_batch:
+            logger.info(f"   Mode: BATCH (OpenAI Batch API)")
+        if not use_cache:
+            logger.info(f"   Mode: NO CACHE")
 
         # Initialize translator
-        translator = MultiLanguageTranslator(metadata_file, strings_file, target_languages, metadata_subdir)
-
-        # Translate
-        all_translations = translator.translate_all(specific_key, dry_run, force)
-
-        # Save if requested
-        if not dry_run and save_output and all_translations:
-            translator.save_translations(all_translations)
-            logger.info(f"\n✅ Translation complete!")
-            # Extract directory path from strings_rel_path (remove /values/strings.xml)
-            res_dir = '/'.join(strings_rel_path.split('/')[:-2])
-            logger.info(f"   Check: {res_dir}/values-*/strings.xml")
+        translator = MultiLanguageTranslator(metadata_file, strings_file, target_languages, metadata_subdir,
+                                             use_cache=use_cache, provider=args.provider,
+                                             concurrency=args.concurrency)
+        if clear_cache:
+            translator.clear_cache()
+
+        # Translate, then save if requested (the cache stays open to record source hashes)
+        try:
+            all_translations = translator.translate_all(specific_key, dry_run, force, use_batch)
+
+            if not dry_run and save_output and all_translations:
+                translator.save_translations(all_translations)
+                logger.info(f"\n✅ Translation complete!")
+                # Extract directory path from strings_rel_path (remove /values/strings.xml)
+                res_dir = '/'.join(strings_rel_path.split('/')[:-2])
+                logger.info(f"   Check: {res_dir}/values-*/strings.xml")
+        finally:
+            translator.close_cache()
 
         logger.info(f"\n📝 Full log saved to: {log_file}")
 
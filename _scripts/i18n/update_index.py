@@ -6,13 +6,12 @@ Usage:
     python update_index.py
 """
 
-import json
-import yaml
 from pathlib import Path
 from datetime import datetime
+from metadata_io import create_metadata_io
 
 METADATA_DIR = Path(__file__).parent / "metadata_divesms"
-INDEX_FILE = METADATA_DIR / "index.json"
+
 
 def main():
     print("=" * 80)
@@ -20,10 +19,11 @@ def main():
     print("=" * 80)
     print()
 
+    metadata_io = create_metadata_io(METADATA_DIR.parent, METADATA_DIR.name)
+
     # Load existing index
-    if INDEX_FILE.exists():
-        with open(INDEX_FILE, 'r', encoding='utf-8') as f:
-            index = json.load(f)
+    if metadata_io.is_split_format():
+        index = metadata_io._load_index()
     else:
         index = {
             "version": "1.0",
@@ -41,20 +41,19 @@ def main():
     files = {}
     total_strings = 0
 
-    yaml_files = sorted(METADATA_DIR.glob("*.yaml"))
+    # Category files come from MetadataIO's single directory sweep
+    category_names = metadata_io.get_available_categories()
 
-    print(f"📂 Scanning {len(yaml_files)} category files...")
+    print(f"📂 Scanning {len(category_names)} category files...")
     print()
 
-    for yaml_file in yaml_files:
-        category = yaml_file.stem
-
-        with open(yaml_file, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f) or {}
+    # Unchanged category files come from MetadataIO's parse cache instead of being re-parsed
+    keys_by_category = metadata_io.get_category_keys(category_names)
 
-        string_keys = sorted(data.keys())
+    for category in category_names:
+        string_keys = keys_by_category[category]
         categories[category] = string_keys
-        files[category] = f"metadata_divesms/{yaml_file.name}"
+        files[category] = f"metadata_divesms/{category}.yaml"
         total_strings += len(string_keys)
 
         print(f"  ✓ {category:20s}: {len(string_keys):3d} strings")
@@ -66,12 +65,14 @@ def main():
     index["documented_strings"] = total_strings
     index["last_updated"] = datetime.now().strftime("%Y-%m-%d")
 
-    # Save index
-    with open(INDEX_FILE, 'w', encoding='utf-8') as f:
-        json.dump(index, f, indent=2, ensure_ascii=False)
+    # Save index (atomically; also rebuilds the merged metadata bundle so tools
+    # can skip per-category YAML parsing)
+    metadata_io.save_index(index)
 
     print()
     print(f"💾 Saved index.json")
+    if metadata_io.bundle_path.exists():
+        print(f"💾 Saved {metadata_io.bundle_path.name}")
     print()
     print("=" * 80)
     print(f"✅ Index updated!")